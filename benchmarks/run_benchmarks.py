@@ -14,6 +14,10 @@ def main():
                       help="Directory for benchmark results")
     parser.add_argument("--reread", action="store_true",
                       help="Reread the file for each query (default: False)")
+    parser.add_argument("--precise-mem", action="store_true",
+                      help="Trace memory of an extra query pass with tracemalloc (default: False)")
+    parser.add_argument("--workers", type=int, default=None,
+                      help="Number of benchmark processes (default: CPU count)")
     args = parser.parse_args()
     
     queries = [
@@ -29,7 +33,7 @@ def main():
         # "data structures"
     ]
     
-    benchmark = Benchmark(args.output_dir)
+    benchmark = Benchmark(args.output_dir, precise_memory=args.precise_mem)
     
     print("Running benchmarks...")
     print("===================")
@@ -40,7 +44,8 @@ def main():
     benchmark.run_benchmark(
         file_sizes=args.sizes,
         queries=queries,
-        reread=args.reread
+        reread=args.reread,
+        max_workers=args.workers
     )
     
     print("\nGenerating reports...")
@@ -1,33 +1,41 @@
 import os
-import subprocess
 import argparse
+import datetime
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 
 def generate_certificates(output_dir: str = ".") -> None:
     os.makedirs(output_dir, exist_ok=True)
     key_file = os.path.join(output_dir, "server.key")
-    subprocess.run([
-        "openssl", "genrsa",
-        "-out", key_file,
-        "2048"
-    ], check=True)
-    csr_file = os.path.join(output_dir, "server.csr")
-    subprocess.run([
-        "openssl", "req",
-        "-new",
-        "-key", key_file,
-        "-out", csr_file,
-        "-subj", "/CN=localhost"
-    ], check=True)
     cert_file = os.path.join(output_dir, "server.crt")
-    subprocess.run([
-        "openssl", "x509",
-        "-req",
-        "-days", "365",
-        "-in", csr_file,
-        "-signkey", key_file,
-        "-out", cert_file
-    ], check=True)    
-    os.unlink(csr_file)
+    # Key and self-signed certificate are built in-process, with no openssl binary to spawn
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=365))
+        .sign(key, hashes.SHA256())
+    )
+    # The private key is only readable by its owner, as openssl writes it. The mode
+    # given to os.open only applies to new files, so an existing key is narrowed too
+    fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)
+    with open(fd, "wb") as f:
+        f.write(key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ))
+    with open(cert_file, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
     print(f"Generated certificates in {output_dir}:")
     print(f"- Private key: {key_file}")
     print(f"- Certificate: {cert_file}")
@@ -39,9 +47,9 @@ def main():
     args = parser.parse_args()
     try:
         generate_certificates(args.output_dir)
-    except subprocess.CalledProcessError as e:
+    except (OSError, ValueError) as e:
         print(f"Error generating certificates: {e}")
         exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
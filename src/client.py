@@ -1,15 +1,25 @@
 import socket
 import ssl
 import argparse
+import asyncio
+import queue
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+RECV_BUFFER_SIZE = 65536
+NEWLINE = b"\n"
+DNS_TTL = 60.0
 
 
 class SearchClient:
     """
     A client for connecting to a search server and sending queries.
 
+    Each thread keeps one persistent connection to the server and sends all of
+    its queries over it, one newline terminated request and response at a time,
+    so the TCP and TLS handshakes are paid once per thread instead of per query.
+
     Attributes:
         host (str): The server hostname.
         port (int): The server port.
@@ -17,7 +27,9 @@ class SearchClient:
         cert_path (str): Path to the server certificate for SSL verification.
     """
 
-    def __init__(self, host: str, port: int, use_ssl: bool = True, cert_path: str = None) -> None:
+    def __init__(self, host: str, port: int, use_ssl: bool = True, cert_path: str = None,
+                 recv_buf_size: int = RECV_BUFFER_SIZE,
+                 timeout: Optional[float] = None) -> None:
         """
         Initializes the SearchClient.
 
@@ -26,11 +38,29 @@ class SearchClient:
             port (int): The server port.
             use_ssl (bool): Whether to use SSL for the connection.
             cert_path (str): Path to the server certificate for SSL verification.
+            recv_buf_size (int): Size of the buffer responses are read into.
+            timeout (Optional[float]): Timeout of blocking socket operations, in
+                seconds. None blocks indefinitely.
         """
         self.host = host
         self.port = port
         self.use_ssl = use_ssl
         self.cert_path = cert_path
+        self.recv_buf_size = recv_buf_size
+        self.timeout = timeout
+        self._ssl_ctx: Optional[ssl.SSLContext] = None
+        self._last_session: Optional[ssl.SSLSession] = None
+        self._address: Optional[Tuple[str, int]] = None
+        self._address_expires = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[Tuple[socket.socket, BinaryIO]] = []
+
+    def __enter__(self) -> "SearchClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def create_connection(self) -> socket.socket:
         """
@@ -44,7 +74,84 @@ class SearchClient:
         """
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._tune_socket(sock)
+            if self.timeout is not None:
+                sock.settimeout(self.timeout)
             if self.use_ssl:
+                # Offer the last session so the server can resume it with an abbreviated handshake
+                session = self._last_session
+                resume = {'session': session} if session is not None else {}
+                sock = self._ssl_context().wrap_socket(sock, server_hostname=self.host, **resume)
+            try:
+                sock.connect(self._resolve())
+            except OSError:
+                self._forget_address()
+                raise
+            self._remember_session(sock)
+        except (ssl.SSLError, ConnectionResetError) as e:
+            sock.close()
+            print(f"SSL error: {e}")
+            raise ValueError(f"SSL handshake failed - {e}")
+        return sock
+
+    def _resolve(self) -> Tuple[str, int]:
+        """
+        Returns the server address, resolving the hostname at most once per `DNS_TTL`.
+
+        Returns:
+            Tuple[str, int]: The IPv4 address and port to connect to.
+
+        Raises:
+            socket.gaierror: If the hostname cannot be resolved.
+        """
+        with self._lock:
+            if self._address is None or time.monotonic() >= self._address_expires:
+                infos = socket.getaddrinfo(self.host, self.port, socket.AF_INET, socket.SOCK_STREAM)
+                self._address = infos[0][4]
+                self._address_expires = time.monotonic() + DNS_TTL
+            return self._address
+
+    def _forget_address(self) -> None:
+        """
+        Drops the cached server address, so the next connection resolves it again.
+        """
+        with self._lock:
+            self._address = None
+
+    @staticmethod
+    def _tune_socket(sock: socket.socket) -> None:
+        """
+        Sets the TCP options used for short query/response exchanges.
+
+        Args:
+            sock (socket.socket): A TCP socket.
+        """
+        # Queries are tiny, so send them right away instead of waiting on Nagle
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Detect dead peers on long-lived connections
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        try:
+            # Linux only: acknowledge responses without the delayed-ACK timer
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except (AttributeError, OSError):
+            pass
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        """
+        Returns the client SSL context, building it on first use.
+
+        The context, and the certificate store loaded into it, are shared by every
+        connection this client opens.
+
+        Returns:
+            ssl.SSLContext: A TLS 1.2-1.3 client context, verifying the server
+                against `cert_path` when one is given.
+        """
+        context = self._ssl_ctx
+        if context is not None:
+            return context
+        with self._lock:
+            if self._ssl_ctx is None:
                 context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
                 context.minimum_version = ssl.TLSVersion.TLSv1_2
                 context.maximum_version = ssl.TLSVersion.TLSv1_3
@@ -54,18 +161,71 @@ class SearchClient:
                 else:
                     context.check_hostname = False
                     context.verify_mode = ssl.CERT_NONE
-                sock = context.wrap_socket(sock, server_hostname=self.host)
-            sock.connect((self.host, self.port))
-        except (ssl.SSLError, ConnectionResetError) as e:
-            sock.close()
-            print(f"SSL error: {e}")
-            raise ValueError(f"SSL handshake failed - {e}")
-        return sock
+                self._ssl_ctx = context
+            return self._ssl_ctx
+
+    def _remember_session(self, sock: socket.socket) -> None:
+        """
+        Keeps the TLS session of a connection for the next one to resume.
+
+        Args:
+            sock (socket.socket): A connected socket.
+        """
+        if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+            with self._lock:
+                self._last_session = sock.session
+
+    async def open_connection_async(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Opens a connection to the server on the running event loop.
+
+        Returns:
+            Tuple[asyncio.StreamReader, asyncio.StreamWriter]: The connection streams.
+        """
+        context = self._ssl_context() if self.use_ssl else None
+        host, port = self._resolve()
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=context,
+            server_hostname=self.host if context else None,
+            limit=self.recv_buf_size
+        )
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            self._tune_socket(sock)
+        return reader, writer
+
+    async def search_async(self, query: str,
+                           connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter]) -> str:
+        """
+        Sends a search query over an open asynchronous connection.
+
+        Args:
+            query (str): The search query.
+            connection (Tuple[asyncio.StreamReader, asyncio.StreamWriter]): A connection
+                from `open_connection_async`.
+
+        Returns:
+            str: The server's response.
+
+        Raises:
+            ConnectionResetError: If the server closed the connection.
+        """
+        reader, writer = connection
+        writer.write(f"{query}\n".encode('utf-8'))
+        await writer.drain()
+        response = await reader.readline()
+        if not response:
+            raise ConnectionResetError("Connection closed by server")
+        return response.decode('utf-8').strip()
 
     def search(self, query: str) -> str:
         """
         Sends a search query to the server and retrieves the response.
 
+        The query goes over the calling thread's persistent connection. If that
+        connection was closed by the server in the meantime, the query is sent
+        once more over a fresh one.
+
         Args:
             query (str): The search query.
 
@@ -75,39 +235,217 @@ class SearchClient:
         Raises:
             ValueError: If an error occurs during communication.
         """
+        request = query.encode('utf-8')
         try:
-            with self.create_connection() as sock:
-                sock.sendall(f"{query}\n".encode('utf-8'))
-                response = sock.recv(1024).decode('utf-8').strip()
-                return response
+            while True:
+                (sock, reader), reused = self._get_connection()
+                try:
+                    self._send_line(sock, request)
+                    response = reader.readline()
+                    if not reused:
+                        # TLS 1.3 tickets arrive after the handshake, with the first response
+                        self._remember_session(sock)
+                except OSError:
+                    self._drop_connection()
+                    if reused:
+                        continue
+                    raise
+                if not response:
+                    self._drop_connection()
+                    if reused:
+                        continue
+                    raise ConnectionResetError("Connection closed by server")
+                return response.decode('utf-8').strip()
         except socket.error as e:
             raise ValueError(e)
         except Exception as e:
             raise ValueError(f"Error during search: {e}")
 
+    def search_many(self, queries: List[str]) -> List[str]:
+        """
+        Sends several search queries over one connection.
+
+        The queries go back to back over the calling thread's connection, which is
+        looked up once for the whole batch. The server answers one line per
+        request, so each query still waits for its response before the next one
+        is sent.
+
+        Args:
+            queries (List[str]): The search queries.
+
+        Returns:
+            List[str]: The server's responses, in query order.
+
+        Raises:
+            ValueError: If an error occurs during communication.
+        """
+        return [self.search(query) for query in queries]
+
+    @staticmethod
+    def _send_line(sock: socket.socket, data: bytes) -> None:
+        """
+        Sends a payload followed by a newline.
+
+        Plain sockets hand both buffers to the kernel in a single `sendmsg`, so the
+        payload is never copied to append the newline. SSL sockets do not support
+        `sendmsg` and send the joined line instead.
+
+        Args:
+            sock (socket.socket): A connected socket.
+            data (bytes): The payload, without its newline.
+        """
+        if isinstance(sock, ssl.SSLSocket):
+            sock.sendall(data + NEWLINE)
+            return
+        sent = sock.sendmsg([data, NEWLINE])
+        if sent < len(data) + 1:
+            sock.sendall((data + NEWLINE)[sent:])
+
+    def close(self) -> None:
+        """
+        Closes every connection opened by this client.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for sock, reader in connections:
+            self._close_connection(sock, reader)
+
+    def _get_connection(self) -> Tuple[Tuple[socket.socket, BinaryIO], bool]:
+        """
+        Returns the calling thread's connection, opening it if needed.
+
+        Returns:
+            Tuple[Tuple[socket.socket, BinaryIO], bool]: The socket with its buffered
+                reader, and whether the connection was already open.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection, True
+        sock = self.create_connection()
+        connection = (sock, sock.makefile('rb', buffering=self.recv_buf_size))
+        self._local.connection = connection
+        with self._lock:
+            self._connections.append(connection)
+        return connection, False
+
+    def _drop_connection(self) -> None:
+        """
+        Closes and forgets the calling thread's connection.
+        """
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if connection is None:
+            return
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        self._close_connection(*connection)
+
+    @staticmethod
+    def _close_connection(sock: socket.socket, reader: BinaryIO) -> None:
+        try:
+            reader.close()
+            sock.close()
+        except OSError:
+            pass
+
 
 def run_concurrent_searches(client: SearchClient, queries: List[str], num_threads: int = 10) -> None:
     """
     Runs multiple search queries concurrently.
 
+    A fixed set of worker threads drains a shared queue of queries, each over its
+    own persistent connection that it closes once the queue is empty, and keeps
+    its results locally. Worker threads never
+    print; the results are written at once when every query has been answered.
+
     Args:
         client (SearchClient): The search client instance.
         queries (List[str]): A list of search queries.
         num_threads (int): The number of concurrent threads.
     """
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        future_to_query = {
-            executor.submit(client.search, query): query
-            for query in queries
-        }
-
-        for future in as_completed(future_to_query):
-            query = future_to_query[future]
-            try:
-                found = future.result()
-                print(f"Query '{query}' => {found}")
-            except Exception as e:
-                print(f"Query '{query}' generated an exception: {e}")
+    pending: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+    for query in queries:
+        pending.put(query)
+    results: List[List[Tuple[str, Union[str, Exception]]]] = []
+
+    def worker() -> None:
+        done = []
+        results.append(done)
+        try:
+            while True:
+                try:
+                    query = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    done.append((query, client.search(query)))
+                except Exception as e:
+                    done.append((query, e))
+        finally:
+            # The server serves each open connection with one of its worker threads,
+            # so an idle one held open would keep other clients waiting
+            client._drop_connection()
+
+    threads = [threading.Thread(target=worker) for _ in range(min(num_threads, len(queries)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = []
+    for done in results:
+        for query, found in done:
+            if isinstance(found, Exception):
+                lines.append(f"Query '{query}' generated an exception: {found}")
+            else:
+                lines.append(f"Query '{query}' => {found}")
+    if lines:
+        print("\n".join(lines))
+
+
+async def run_concurrent_async(client: SearchClient, queries: List[str], concurrency: int = 10) -> None:
+    """
+    Runs multiple search queries concurrently on a single event loop.
+
+    Up to `concurrency` workers each hold one connection and send their share of
+    the queries over it, so handshakes are paid once per worker.
+
+    Args:
+        client (SearchClient): The search client instance.
+        queries (List[str]): A list of search queries.
+        concurrency (int): The number of concurrent connections.
+    """
+    pending = iter(queries)
+
+    async def worker() -> None:
+        connection = None
+        try:
+            for query in pending:
+                try:
+                    reused = connection is not None
+                    if connection is None:
+                        connection = await client.open_connection_async()
+                    try:
+                        found = await client.search_async(query, connection)
+                    except (ConnectionError, asyncio.IncompleteReadError):
+                        if not reused:
+                            raise
+                        # The server dropped an idle connection; resend once on a new one
+                        connection[1].close()
+                        connection = await client.open_connection_async()
+                        found = await client.search_async(query, connection)
+                    print(f"Query '{query}' => {found}")
+                except Exception as e:
+                    print(f"Query '{query}' generated an exception: {e}")
+                    if connection is not None:
+                        connection[1].close()
+                        connection = None
+        finally:
+            if connection is not None:
+                connection[1].close()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(queries))))))
 
 
 def main() -> None:
@@ -121,7 +459,9 @@ def main() -> None:
     parser.add_argument('--no-ssl', action='store_true', help='Disable SSL')
     parser.add_argument('--cert', help='Path to server certificate for verification')
     parser.add_argument('--queries', nargs='+', default=['test'], help='Search queries to send')
-    parser.add_argument('--threads', type=int, default=100, help='Number of concurrent threads')
+    parser.add_argument('--threads', type=int, default=100, help='Number of concurrent connections')
+    parser.add_argument('--recv-buf-size', type=int, default=RECV_BUFFER_SIZE,
+                        help='Size of the buffer responses are read into, in bytes')
 
     args = parser.parse_args()
 
@@ -129,14 +469,18 @@ def main() -> None:
         host=args.host,
         port=args.port,
         use_ssl=not args.no_ssl,
-        cert_path=args.cert
+        cert_path=args.cert,
+        recv_buf_size=args.recv_buf_size
     )
 
     print(f"Starting client with {args.threads} threads")
     print(f"Connecting to {args.host}:{args.port} {'with' if not args.no_ssl else 'without'} SSL")
 
     start_time = time.time()
-    run_concurrent_searches(client, args.queries, args.threads)
+    try:
+        asyncio.run(run_concurrent_async(client, args.queries, args.threads))
+    finally:
+        client.close()
     end_time = time.time()
 
     print(f"\nCompleted {len(args.queries)} queries in {(end_time - start_time) * 1000:.2f} ms")
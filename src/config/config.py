@@ -1,9 +1,40 @@
 import os
 import sys
 import configparser
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+import shutil
+import stat
+import tempfile
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+
+# Background thread writing the records queued by the "SearchServer" logger
+_log_listener: Optional["QueueListener"] = None
+
+
+def _stop_log_listener() -> None:
+    """Flushes the queued log records and stops the writer thread, if running.
+
+    The queue handler is detached as well, so the next record logged through a
+    configuration sets up a new listener instead of queuing into a dead one.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        logging.getLogger("SearchServer").handlers.clear()
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
 
 
 class ConfigError(Exception):
@@ -21,11 +52,113 @@ class ConfigFileError(ConfigError):
     pass
 
 
+# One line of the INI subset used by server.conf: a section header or a key/value pair
+_INI_LINE_RE = re.compile(r"\[(?P<section>.+)\]|(?P<key>[^=:\s][^=:]*?)\s*[=:]\s*(?P<value>.*)")
+
+
+# Longest value interned by the scanner
+_INTERN_MAX_LEN = 16
+
+
+class _UnsupportedSyntax(Exception):
+    """Raised by the fast scanner on input it leaves to configparser."""
+
+
+def _scan_ini(text: str) -> Dict[str, Dict[str, str]]:
+    """Parses plain `[section]` and `key = value` lines in a single pass.
+
+    Anything beyond that subset (multi-line values, a DEFAULT section, keys
+    outside a section, duplicates, malformed lines) raises `_UnsupportedSyntax`,
+    so the caller can fall back to `configparser` and keep its exact behavior.
+
+    Args:
+        text: Content of the INI file.
+
+    Returns:
+        Raw values by section, with lowercased keys as `ConfigParser` stores them.
+        Section names, keys and short values are interned.
+
+    Raises:
+        _UnsupportedSyntax: If the text is not in the supported subset.
+    """
+    values: Dict[str, Dict[str, str]] = {configparser.DEFAULTSECT: {}}
+    current: Optional[Dict[str, str]] = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        match = _INI_LINE_RE.fullmatch(line)
+        if match is None or raw[0].isspace():
+            raise _UnsupportedSyntax(raw)
+        section = match.group("section")
+        if section is not None:
+            section = sys.intern(section)
+            if section in values:
+                raise _UnsupportedSyntax(raw)
+            current = values[section] = {}
+            continue
+        key = sys.intern(match.group("key").lower())
+        if current is None or key in current:
+            raise _UnsupportedSyntax(raw)
+        value = match.group("value")
+        # Short values (true, INFO, simple...) repeat across files; paths are left alone
+        current[key] = sys.intern(value) if len(value) <= _INTERN_MAX_LEN else value
+    return values
+
+
+def _parse_config_file(path: str) -> Dict[str, Dict[str, str]]:
+    """Parses a configuration file, reusing the result while the file is unchanged.
+
+    Args:
+        path: Path to the configuration INI file.
+
+    Returns:
+        Raw values by section, suitable for `ConfigParser.read_dict`.
+
+    Raises:
+        OSError: If the file cannot be accessed.
+        configparser.Error: If the file cannot be parsed.
+    """
+    info = os.stat(path)
+    return _parse_config_content(path, info.st_mtime_ns, info.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parse_config_content(path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, str]]:
+    """Parses a configuration file once per modification time and size.
+
+    Args:
+        path: Path to the configuration INI file.
+        mtime_ns: Modification time of the file, part of the cache key.
+        size: Size of the file, part of the cache key.
+
+    Returns:
+        Raw values by section, with the DEFAULT section first.
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    try:
+        return _scan_ini(text)
+    except _UnsupportedSyntax:
+        pass
+    parser = configparser.ConfigParser()
+    parser.read_string(text, source=path)
+    defaults = dict(parser.defaults())
+    values = {configparser.DEFAULTSECT: defaults}
+    for section in parser.sections():
+        # Keep inherited defaults out of the section, as the file has them
+        values[section] = {
+            key: value for key, value in parser.items(section, raw=True)
+            if defaults.get(key) != value
+        }
+    return values
+
+
 class Config:
     """Manages server configuration and logging setup.
 
-    Reads settings from an INI file, validates them, and initializes a logger
-    with both console and file handlers (if specified).
+    Reads settings from an INI file and validates them. The logger, with both
+    console and file handlers (if specified), is set up on first use.
 
     Attributes:
         host (str): Server host address.
@@ -41,11 +174,20 @@ class Config:
         case_sensitive (bool): Whether search is case-sensitive.
         log_level (str): Logging level (e.g., "INFO", "DEBUG").
         log_file (Optional[str]): Path to log file (if specified).
-        logger (Optional[logging.Logger]): Configured logger instance.
+        logger (logging.Logger): Configured logger instance, created on first access.
     """
 
-    VALID_LOG_LEVELS = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
-    VALID_ALGORITHMS = {'simple', 'inmemory', 'binary', 'hash', 'regex', 'bloom', 'boyermoore', 'kmp', 'rabinkarp', 'grep'}
+    __slots__ = (
+        'config_file', 'config', '_logger', '_dirty', '_flush_registered',
+        'host', 'port', 'use_ssl', 'ssl_cert', 'ssl_key', 'workers', 'debug',
+        'linux_path', 'search_algorithm', 'reread_on_query', 'case_sensitive',
+        'log_level', '_log_level_name', 'log_file',
+    )
+
+    VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+    VALID_ALGORITHMS = frozenset({'simple', 'inmemory', 'binary', 'hash', 'regex', 'bloom', 'boyermoore', 'kmp', 'rabinkarp', 'grep'})
+    _VALID_LOG_LEVELS_STR = ', '.join(sorted(VALID_LOG_LEVELS))
+    _VALID_ALGORITHMS_STR = ', '.join(sorted(VALID_ALGORITHMS))
 
     def __init__(self, config_file: str = "src/config/server.conf") -> None:
         """Initializes the configuration from a file.
@@ -59,17 +201,28 @@ class Config:
         """
         self.config_file = config_file
         self.config = configparser.ConfigParser()
-        self.logger: Optional[logging.Logger] = None
+        self._logger: Optional[logging.Logger] = None
+        self._dirty = False
+        self._flush_registered = False
 
-        try:
-            self._load_config_file()
-            self._parse_configuration()
-            self._validate_config()
+        self._load_config_file()
+        self._parse_configuration()
+        self._validate_config()
+
+    @property
+    def logger(self) -> logging.Logger:
+        """The server logger, initialized on first access.
+
+        The logger and its listener are shared by the whole process; they are set
+        up again if the listener was stopped, for instance by another
+        configuration's `close()`.
+
+        Raises:
+            ConfigError: If logger setup fails.
+        """
+        if self._logger is None or _log_listener is None:
             self._initiate_logger()
-        except (ConfigFileError, ConfigValidationError) as e:
-            raise
-        except Exception as e:
-            raise ConfigError(f"Unexpected error during configuration initialization: {e}") from e
+        return self._logger
 
     def _load_config_file(self) -> None:
         """Loads and parses the configuration file.
@@ -84,7 +237,7 @@ class Config:
             raise ConfigFileError(f"Configuration file '{self.config_file}' is not readable")
 
         try:
-            self.config.read(self.config_file)
+            self.config.read_dict(_parse_config_file(self.config_file))
         except configparser.Error as e:
             raise ConfigFileError(f"Failed to parse configuration file '{self.config_file}': {e}") from e
         except Exception as e:
@@ -96,6 +249,42 @@ class Config:
         if missing_sections:
             raise ConfigFileError(f"Missing required sections in config file: {missing_sections}")
 
+    def _lookup(self, section: str, key: str) -> Optional[str]:
+        """Retrieves a raw value from config with a single section lookup.
+
+        Args:
+            section: Configuration section name.
+            key: Key within the section.
+
+        Returns:
+            The value, or None if the section or key is not present.
+        """
+        try:
+            return self.config[section].get(key)
+        except KeyError:
+            return None
+
+    def _get_required_value(self, section: str, key: str) -> str:
+        """Retrieves a required value from config, stripped of surrounding whitespace.
+
+        Args:
+            section: Configuration section name.
+            key: Key within the section.
+
+        Returns:
+            Stripped string value.
+
+        Raises:
+            ConfigValidationError: If value is missing or empty.
+        """
+        value = self._lookup(section, key)
+        if value is None:
+            raise ConfigValidationError(f"Required configuration '{section}.{key}' not found")
+        stripped = value.strip()
+        if not stripped:
+            raise ConfigValidationError(f"Required configuration '{section}.{key}' is empty")
+        return stripped
+
     def _get_required_int(self, section: str, key: str) -> int:
         """Retrieves a required integer value from config.
         
@@ -109,15 +298,9 @@ class Config:
         Raises:
             ConfigValidationError: If value is missing or cannot be converted to int.
         """
-        if section not in self.config or key not in self.config[section]:
-            raise ConfigValidationError(f"Required configuration '{section}.{key}' not found")
-        
-        value = self.config[section].get(key)
-        if not value or not value.strip():
-            raise ConfigValidationError(f"Required configuration '{section}.{key}' is empty")
-        
+        value = self._get_required_value(section, key)
         try:
-            return self.config[section].getint(key)
+            return int(value)
         except ValueError as e:
             raise ConfigValidationError(f"Invalid integer value for '{section}.{key}': '{value}'") from e
 
@@ -134,16 +317,10 @@ class Config:
         Raises:
             ConfigValidationError: If value is missing or cannot be converted to bool.
         """
-        if section not in self.config or key not in self.config[section]:
-            raise ConfigValidationError(f"Required configuration '{section}.{key}' not found")
-        
-        value = self.config[section].get(key)
-        if not value or not value.strip():
-            raise ConfigValidationError(f"Required configuration '{section}.{key}' is empty")
-        
+        value = self._get_required_value(section, key)
         try:
-            return self.config[section].getboolean(key)
-        except ValueError as e:
+            return self.config.BOOLEAN_STATES[value.lower()]
+        except KeyError as e:
             raise ConfigValidationError(f"Invalid boolean value for '{section}.{key}': '{value}'. Use true/false, yes/no, or 1/0") from e
 
     def _get_required_str(self, section: str, key: str) -> str:
@@ -159,14 +336,7 @@ class Config:
         Raises:
             ConfigValidationError: If value is missing or empty.
         """
-        if section not in self.config or key not in self.config[section]:
-            raise ConfigValidationError(f"Required configuration '{section}.{key}' not found")
-        
-        value = self.config[section].get(key)
-        if not value or not value.strip():
-            raise ConfigValidationError(f"Required configuration '{section}.{key}' is empty")
-        
-        return value.strip()
+        return self._get_required_value(section, key)
 
     def _get_optional_str(self, section: str, key: str) -> Optional[str]:
         """Retrieves an optional string value from config.
@@ -178,14 +348,10 @@ class Config:
         Returns:
             String value or None if not present or empty.
         """
-        if section not in self.config or key not in self.config[section]:
-            return None
-        
-        value = self.config[section].get(key)
-        if not value or not value.strip():
+        value = self._lookup(section, key)
+        if value is None:
             return None
-        
-        return value.strip()
+        return value.strip() or None
 
     def _parse_configuration(self) -> None:
         """Parses all configuration values with strict validation."""
@@ -212,6 +378,7 @@ class Config:
 
         # Logging configuration
         self.log_level = self._get_required_str("LOGGING", "LEVEL")
+        self._log_level_name = self.log_level.upper()
         self.log_file = self._get_optional_str("LOGGING", "FILE")  # Optional
 
     def _create_log_file(self, log_path: str) -> None:
@@ -226,26 +393,41 @@ class Config:
         try:
             directory = os.path.dirname(log_path)
             if directory:
-                if not os.path.exists(directory):
-                    os.makedirs(directory, mode=0o755)
-                elif not os.access(directory, os.W_OK):
-                    raise ConfigError(f"Log directory '{directory}' is not writable")
-                
-            if os.path.exists(log_path):
-                if not os.access(log_path, os.W_OK):
-                    raise ConfigError(f"Log file '{log_path}' is not writable")
-            else:
-                try:
-                    with open(log_path, "x", encoding="utf-8") as f:
-                        pass
-                except FileExistsError:
-                    pass
-                except PermissionError:
-                    raise ConfigError(f"Permission denied when creating log file '{log_path}'")
+                os.makedirs(directory, mode=0o755, exist_ok=True)
+
+            # Opening for writing both creates a missing file and checks the file and its directory
+            try:
+                os.close(os.open(log_path, os.O_WRONLY | os.O_CREAT, 0o644))
+            except PermissionError:
+                raise ConfigError(f"Log file '{log_path}' is not writable")
                     
         except OSError as e:
             raise ConfigError(f"Failed to create log file or directory for '{log_path}': {e}") from e
 
+    @staticmethod
+    def _check_readable_file(path: str, not_found: str, not_readable: str, not_file: str) -> None:
+        """Checks that a path is a readable regular file, with a single stat call.
+
+        Args:
+            path: Path to check.
+            not_found: Error message if the path does not exist.
+            not_readable: Error message if the path is not readable.
+            not_file: Error message if the path is not a regular file.
+
+        Raises:
+            ConfigValidationError: If any check fails.
+        """
+        try:
+            mode = os.stat(path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            raise ConfigValidationError(not_found)
+        except PermissionError:
+            raise ConfigValidationError(not_readable)
+        if not os.access(path, os.R_OK):
+            raise ConfigValidationError(not_readable)
+        if not stat.S_ISREG(mode):
+            raise ConfigValidationError(not_file)
+
     def _validate_config(self) -> None:
         """Validates all configuration settings strictly.
 
@@ -260,18 +442,18 @@ class Config:
         if self.workers > 10_000:
             raise ConfigValidationError(f"Workers should not exceed 10 000, got: {self.workers}")
 
-        if not os.path.exists(self.linux_path):
-            raise ConfigValidationError(f"Search path does not exist: '{self.linux_path}'")
-        if not os.access(self.linux_path, os.R_OK):
-            raise ConfigValidationError(f"Search path is not readable: '{self.linux_path}'")
-        if not os.path.isfile(self.linux_path):
-            raise ConfigValidationError(f"Search path is not a file: '{self.linux_path}'")
+        self._check_readable_file(
+            self.linux_path,
+            f"Search path does not exist: '{self.linux_path}'",
+            f"Search path is not readable: '{self.linux_path}'",
+            f"Search path is not a file: '{self.linux_path}'",
+        )
 
         # Validate search algorithm
         if self.search_algorithm not in self.VALID_ALGORITHMS:
             raise ConfigValidationError(
                 f"Invalid search algorithm '{self.search_algorithm}'. "
-                f"Valid options: {', '.join(sorted(self.VALID_ALGORITHMS))}"
+                f"Valid options: {self._VALID_ALGORITHMS_STR}"
             )
 
         # Validate SSL configuration when enabled
@@ -281,25 +463,24 @@ class Config:
             if not self.ssl_key:
                 raise ConfigValidationError("SSL is enabled but SSL_KEY is missing or empty")
             
-            if not os.path.exists(self.ssl_cert):
-                raise ConfigValidationError(f"SSL certificate file not found: '{self.ssl_cert}'")
-            if not os.access(self.ssl_cert, os.R_OK):
-                raise ConfigValidationError(f"SSL certificate file is not readable: '{self.ssl_cert}'")
-            if not os.path.isfile(self.ssl_cert):
-                raise ConfigValidationError(f"SSL certificate path is not a file: '{self.ssl_cert}'")
-                
-            if not os.path.exists(self.ssl_key):
-                raise ConfigValidationError(f"SSL key file not found: '{self.ssl_key}'")
-            if not os.access(self.ssl_key, os.R_OK):
-                raise ConfigValidationError(f"SSL key file is not readable: '{self.ssl_key}'")
-            if not os.path.isfile(self.ssl_key):
-                raise ConfigValidationError(f"SSL key path is not a file: '{self.ssl_key}'")
+            self._check_readable_file(
+                self.ssl_cert,
+                f"SSL certificate file not found: '{self.ssl_cert}'",
+                f"SSL certificate file is not readable: '{self.ssl_cert}'",
+                f"SSL certificate path is not a file: '{self.ssl_cert}'",
+            )
+            self._check_readable_file(
+                self.ssl_key,
+                f"SSL key file not found: '{self.ssl_key}'",
+                f"SSL key file is not readable: '{self.ssl_key}'",
+                f"SSL key path is not a file: '{self.ssl_key}'",
+            )
 
         # Validate log level
-        if self.log_level.upper() not in self.VALID_LOG_LEVELS:
+        if self._log_level_name not in self.VALID_LOG_LEVELS:
             raise ConfigValidationError(
                 f"Invalid log level '{self.log_level}'. "
-                f"Valid options: {', '.join(sorted(self.VALID_LOG_LEVELS))}"
+                f"Valid options: {self._VALID_LOG_LEVELS_STR}"
             )
 
         # Validate log file if specified
@@ -318,31 +499,32 @@ class Config:
             - Console handler (stderr).
             - File handler (if `log_file` is specified).
             - Log rotation (10MB per file, max 3 backups).
+
+        The logger itself only enqueues records; the handlers run on a background
+        listener thread, so logging threads never wait on each other's writes.
             
         Raises:
             ConfigError: If logger setup fails.
         """
+        # logging.handlers is only imported by processes that actually log
+        from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
         log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
         formatter = logging.Formatter(log_format)
 
         try:
-            log_level = getattr(logging, self.log_level.upper())
+            log_level = getattr(logging, self._log_level_name)
         except AttributeError:
             raise ConfigError(f"Invalid log level: {self.log_level}")
 
-        self.logger = logging.getLogger("SearchServer")
-        self.logger.setLevel(log_level)
-
-        # Clear existing handlers to avoid duplicates
-        if self.logger.hasHandlers():
-            self.logger.handlers.clear()
+        handlers = []
 
         # Console handler setup 
         try:
             console_handler = logging.StreamHandler(sys.stderr)
             console_handler.setFormatter(formatter)
             console_handler.setLevel(log_level)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
         except Exception as e:
             raise ConfigError(f"Failed to initialize console logging: {e}") from e
 
@@ -355,13 +537,31 @@ class Config:
                     maxBytes=10 * 1024 * 1024,  # 10MB
                     backupCount=3,
                     encoding="utf-8",
+                    delay=True,  # Opened by the first record that reaches the file
                 )
                 file_handler.setFormatter(formatter)
                 file_handler.setLevel(log_level)
-                self.logger.addHandler(file_handler)
+                handlers.append(file_handler)
             except Exception as e:
                 raise ConfigError(f"Failed to initialize file logging for '{self.log_file}': {e}") from e
 
+        global _log_listener
+        logger = logging.getLogger("SearchServer")
+        logger.setLevel(log_level)
+        logger.propagate = False
+
+        # Replace handlers and listener left by a previous configuration to avoid duplicates
+        _stop_log_listener()
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        self._logger = logger
+
     def get(self, section: str, key: str) -> Any:
         """Retrieves a raw value from the configuration.
 
@@ -392,6 +592,9 @@ class Config:
     def save(self, config_file: Optional[str] = None) -> None:
         """Saves the current configuration to a file.
 
+        The file is replaced atomically: the content is written and synced to a
+        temporary file that is then renamed over the target.
+
         Args:
             config_file: Path to the output INI file. If None, uses original config file.
             
@@ -401,29 +604,56 @@ class Config:
         target_file = config_file or self.config_file
         
         try:
-            # Test write permissions first
+            # A missing directory is created; an unwritable one fails when the file is opened
             directory = os.path.dirname(target_file)
             if directory:
-                if not os.path.exists(directory):
-                    os.makedirs(directory, mode=0o755)
-                elif not os.access(directory, os.W_OK):
-                    raise ConfigError(f"Directory '{directory}' is not writable")
+                os.makedirs(directory, mode=0o755, exist_ok=True)
+
+            try:
+                target_mode: Optional[int] = os.stat(target_file).st_mode
+            except FileNotFoundError:
+                target_mode = None
             
             # Create backup if file exists
-            if os.path.exists(target_file):
+            if target_mode is not None:
                 if not os.access(target_file, os.W_OK):
                     raise ConfigError(f"Config file '{target_file}' is not writable")
                 
                 backup_file = f"{target_file}.backup"
                 try:
-                    import shutil
-                    shutil.copy2(target_file, backup_file)
+                    # The target is replaced rather than rewritten, so a hard link keeps the old content
+                    try:
+                        os.unlink(backup_file)
+                    except FileNotFoundError:
+                        pass
+                    try:
+                        os.link(target_file, backup_file)
+                    except OSError:
+                        shutil.copy2(target_file, backup_file)
                 except Exception as e:
                     if self.logger:
                         self.logger.warning(f"Failed to create backup of config file: {e}")
             
-            with open(target_file, "w", encoding="utf-8") as f:
-                self.config.write(f)
+            # Write a temporary file and swap it in, so the config file is never left half written
+            try:
+                fd, tmp_file = tempfile.mkstemp(
+                    dir=directory or os.curdir, prefix=f".{os.path.basename(target_file)}.", suffix=".tmp"
+                )
+            except PermissionError:
+                raise ConfigError(f"Directory '{directory or os.curdir}' is not writable")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    self.config.write(f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.chmod(tmp_file, stat.S_IMODE(target_mode) if target_mode is not None else 0o644)
+                os.replace(tmp_file, target_file)
+            except BaseException:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+                raise
+            if target_file == self.config_file:
+                self._dirty = False
                 
             if self.logger:
                 self.logger.info(f"Configuration saved to: {target_file}")
@@ -436,12 +666,15 @@ class Config:
     def remove_option(self, section: str, key: str) -> None:
         """Removes a key from the configuration.
 
+        The change is written to the config file by `flush`, which also runs at
+        interpreter exit, so several removals cost a single save.
+
         Args:
             section: INI section name.
             key: Key within the section.
             
         Raises:
-            ConfigError: If section or key doesn't exist, or file cannot be saved.
+            ConfigError: If section or key doesn't exist.
         """
         if section not in self.config:
             raise ConfigError(f"Configuration section '{section}' not found")
@@ -451,31 +684,60 @@ class Config:
         
         try:
             del self.config[section][key]
-            self.save()
+            self._mark_dirty()
             if self.logger:
                 self.logger.info(f"Removed configuration option: {section}.{key}")
         except Exception as e:
             raise ConfigError(f"Failed to remove configuration option '{section}.{key}': {e}") from e
 
+    def flush(self) -> None:
+        """Saves pending changes to the original config file, if there are any.
+
+        Raises:
+            ConfigError: If file cannot be written.
+        """
+        if self._dirty:
+            self.save()
+
+    def close(self) -> None:
+        """Saves pending changes, then flushes and stops the log listener.
+
+        There is one listener for the whole process, otherwise stopped only at
+        exit. The logger is set up again if it is used afterwards.
+
+        Raises:
+            ConfigError: If file cannot be written.
+        """
+        try:
+            self.flush()
+        finally:
+            _stop_log_listener()
+
+    def _mark_dirty(self) -> None:
+        """Records an unsaved change and makes sure it is flushed at exit."""
+        self._dirty = True
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+
     def reload(self) -> None:
         """Reloads configuration from the original file.
+
+        The file is loaded into a new instance first, so this one is left
+        untouched if the new configuration is invalid.
         
         Raises:
-            ConfigFileError: If file cannot be reloaded.
-            ConfigValidationError: If reloaded config is invalid.
+            ConfigError: If the file cannot be reloaded or the new configuration is invalid.
         """
         try:
-            old_config = self.config
-            old_logger = self.logger
-            
-            # Reinitialize
-            self.__init__(self.config_file)
-            
-            if self.logger:
-                self.logger.info("Configuration reloaded successfully")
-                
-        except Exception as e:
-            # Restore previous state if reload fails
-            self.config = old_config
-            self.logger = old_logger
-            raise ConfigError(f"Failed to reload configuration: {e}") from e
\ No newline at end of file
+            reloaded = type(self)(self.config_file)
+        except ConfigError as e:
+            raise ConfigError(f"Failed to reload configuration: {e}") from e
+
+        # Write out records logged under the old settings before switching log files
+        _stop_log_listener()
+        for name in self.__slots__:
+            # The exit hook registered for this instance stays valid
+            if name != '_flush_registered':
+                setattr(self, name, getattr(reloaded, name))
+        self.logger.info("Configuration reloaded successfully")
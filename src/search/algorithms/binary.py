@@ -1,5 +1,6 @@
 import os
 import time
+from bisect import bisect_left
 from typing import List
 from src.search.base import SearchAlgorithm
 
@@ -27,7 +28,7 @@ class BinarySearch(SearchAlgorithm):
         """
         self.file_path = file_path
         self.reread_on_query = reread_on_query
-        self.stats = {"comparisons": 0, "time_taken": 0.0}
+        self.stats = {"comparisons": 0, "search_time_ns": 0}
         self._lines = []
         self.case_sensitive = case_sensitive
         self._sorted_lines: List[str] = []
@@ -40,14 +41,17 @@ class BinarySearch(SearchAlgorithm):
         Read and sort the lines from the file.
 
         This method reads the file specified by `file_path`, decodes its lines,
-        and stores them in `_sorted_lines` in sorted order.
+        and stores them in `_sorted_lines` in sorted order. The sort is skipped
+        when `_read_file` kept the cached lines because the file is unchanged.
         """
+        lines = self._lines
         self._read_file()
-        self._sorted_lines = sorted(self._lines)
+        if self._lines is not lines or not self._sorted_lines:
+            self._sorted_lines = sorted(self._lines)
 
     def search(self, query: str) -> bool:
         """
-        Perform a binary search for the query string.
+        Perform a binary search for the query string using `bisect`.
 
         Args:
             query (str): The string to search for.
@@ -55,28 +59,21 @@ class BinarySearch(SearchAlgorithm):
         Returns:
             bool: True if the query is found, False otherwise.
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         self.stats["comparisons"] = 0
         if not self.case_sensitive:
             query = query.lower()
         if self.reread_on_query:
             self._read_and_sort_file()
 
-        left, right = 0, len(self._sorted_lines) - 1
-        while left <= right:
-            mid = (left + right) // 2
-            self.stats["comparisons"] += 1
+        # bisect runs the O(log n) comparison loop in C over the sorted lines
+        sorted_lines = self._sorted_lines
+        index = bisect_left(sorted_lines, query)
+        self.stats["comparisons"] = len(sorted_lines).bit_length()
+        result = index < len(sorted_lines) and sorted_lines[index] == query
 
-            if self._sorted_lines[mid] == query:
-                self.stats["time_taken"] = time.time() - start_time
-                return True
-            elif self._sorted_lines[mid] < query:
-                left = mid + 1
-            else:
-                right = mid - 1
-
-        self.stats["time_taken"] = time.time() - start_time
-        return False
+        self.stats["search_time_ns"] = time.perf_counter_ns() - start_time
+        return result
 
     def get_stats(self) -> dict:
         """
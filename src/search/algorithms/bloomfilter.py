@@ -1,7 +1,8 @@
+import os
 import time
-from typing import Set
+from typing import FrozenSet, Optional, Tuple
 from pybloom_live import BloomFilter
-from src.search.base import SearchAlgorithm
+from src.search.base import SearchAlgorithm, split_lines, ASCII_WHITESPACE
 
 
 class BloomFilterSearch(SearchAlgorithm):
@@ -11,12 +12,20 @@ class BloomFilterSearch(SearchAlgorithm):
     This class provides an implementation of a search algorithm using a Bloom
     filter for efficient membership testing.
 
+    By default queries are answered exactly from the set of lines, and no filter
+    is built. With `exact=False` only the Bloom filter is kept, trading a bounded
+    false positive rate for a memory footprint of a few bits per line.
+
     Attributes:
         file_path (str): Path to the file to be searched.
         reread_on_query (bool): Whether to reread the file for each query.
         stats (dict): Statistics about the search process.
-        _bloom (BloomFilter): The Bloom filter used for membership testing.
-        _lines (Set[str]): A set of lines read from the file.
+        capacity (int): Minimum capacity of the Bloom filter.
+        error_rate (float): The acceptable error rate for the Bloom filter.
+        exact (bool): Whether queries are answered from the line set instead of the filter.
+        _bloom (Optional[BloomFilter]): The Bloom filter, built only when not exact.
+        _lines (FrozenSet[str]): The distinct lines read from the file, empty when not exact.
+        _lengths (FrozenSet[int]): The distinct line lengths, used to reject queries early.
     """
 
     def __init__(
@@ -25,7 +34,8 @@ class BloomFilterSearch(SearchAlgorithm):
         reread_on_query: bool = False,
         capacity: int = 1_000_000,
         error_rate: float = 0.001,
-        case_sensitive: bool = True
+        case_sensitive: bool = True,
+        exact: bool = True
     ) -> None:
         """
         Initialize the BloomFilterSearch instance.
@@ -35,11 +45,18 @@ class BloomFilterSearch(SearchAlgorithm):
             reread_on_query (bool): Whether to reread the file for each query.
             capacity (int): The capacity of the Bloom filter.
             error_rate (float): The acceptable error rate for the Bloom filter.
+            exact (bool): Whether to keep the lines and answer exactly, or keep only
+                the Bloom filter.
         """
         super().__init__(file_path)
-        self.stats = {"search_time": 0.0}
-        self._bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
-        self._lines: Set[str] = set()
+        self.stats = {"search_time_ns": 0}
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.exact = exact
+        self._bloom: Optional[BloomFilter] = None
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._lines: FrozenSet[str] = frozenset()
+        self._lengths: FrozenSet[int] = frozenset()
         self.case_sensitive = case_sensitive
         self.reread_on_query = reread_on_query
 
@@ -48,21 +65,35 @@ class BloomFilterSearch(SearchAlgorithm):
 
     def _read_file(self) -> None:
         """
-        Read the file and populate the Bloom filter and line set.
+        Read the file and populate the line set or the Bloom filter.
 
-        This method reads the file specified by `file_path`, decodes its lines,
-        and adds them to the Bloom filter and the `_lines` set.
+        This method reads the file specified by `file_path` and decodes its
+        distinct lines. They are kept as the `_lines` set when searching exactly,
+        otherwise each is added to a Bloom filter sized for at least that many
+        entries and the lines are discarded. Nothing is rebuilt while the file
+        keeps its modification time and size.
         """
         try:
+            info = os.stat(self.file_path)
+            file_state = (info.st_mtime_ns, info.st_size)
+            if file_state == self._file_state:
+                return
             with open(self.file_path, 'rb') as file:
-                self._bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
-                self._lines.clear()
-                for line in file:
-                    line_str = line.rstrip().decode('utf-8')
-                    if not self.case_sensitive:
-                        line_str = line_str.lower()
-                    self._bloom.add(line_str)
-                    self._lines.add(line_str)
+                data = file.read()
+            # Each structure is built whole and then swapped in, so a concurrent search
+            # never sees it half built
+            lines = frozenset(split_lines(data, self.case_sensitive))
+            self._lengths = frozenset(map(len, lines))
+            if self.exact:
+                self._lines = lines
+            else:
+                bloom = BloomFilter(capacity=max(self.capacity, len(lines), 1), error_rate=self.error_rate)
+                # Set members are distinct, so the per-bit "already present" probes are skipped
+                add = bloom.add
+                for line_str in lines:
+                    add(line_str, skip_check=True)
+                self._bloom = bloom
+            self._file_state = file_state
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {self.file_path}")
         except Exception as e:
@@ -70,22 +101,33 @@ class BloomFilterSearch(SearchAlgorithm):
 
     def search(self, query: str) -> bool:
         """
-        Perform a search for the query string using the Bloom filter.
+        Perform a search for the query string against the line set or the filter.
 
         Args:
             query (str): The string to search for.
 
         Returns:
-            bool: True if the query is found, False otherwise.
+            bool: True if the query is found, False otherwise. When not exact, a
+                missing query may be reported found at the filter's error rate.
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
-        if self.reread_on_query:
-            self._read_file()
         if not self.case_sensitive:
             query = query.lower()
-        result = query in self._bloom and query in self._lines
-        self.stats["search_time"] = time.time() - start_time
+        # Stored lines never hold a newline or trailing whitespace, so such queries are
+        # rejected before paying for a reread or a set lookup
+        if '\n' in query or query.rstrip(ASCII_WHITESPACE) != query:
+            self.stats["search_time_ns"] = time.perf_counter_ns() - start_time
+            return False
+
+        if self.reread_on_query:
+            self._read_file()
+        # The length check is a single small-int lookup that spares hashing the query
+        if self.exact:
+            result = len(query) in self._lengths and query in self._lines
+        else:
+            result = len(query) in self._lengths and query in self._bloom
+        self.stats["search_time_ns"] = time.perf_counter_ns() - start_time
         return result
 
     def get_stats(self) -> dict:
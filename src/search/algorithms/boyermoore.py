@@ -1,11 +1,12 @@
 import re
 import time
 import os
-from typing import Iterator, Dict, List, Optional, Set
-import mmh3
-from pybloom_live import BloomFilter
-import datrie
+from functools import lru_cache
+from typing import Iterable, Iterator, Dict, List, Optional, Set, Tuple
 from src.search.base import SearchAlgorithm
+from src.search import bmh_njit
+
+PATTERN_CACHE_SIZE = 1024
 
 class BoyerMoore(SearchAlgorithm):
     """
@@ -20,6 +21,12 @@ class BoyerMoore(SearchAlgorithm):
         reread_on_query (bool): Determines whether the file should be re-read on
             every search query. Defaults to False.
         _lines (List[str]): List of lines from the file.
+        workers (int): Number of threads the JIT kernel may split large files over.
+        _packed (Optional[Tuple]): The lines encoded into one byte array for the JIT
+            kernel, or None when Numba is unavailable.
+        _by_length (Optional[Dict[int, List[str]]]): Lines grouped by length for the
+            interpreted loop, built on its first use.
+        _tables (Callable): LRU cache of the shift tables built for recent queries.
         _stats (dict): Dictionary to store statistics about the search process,
             including the number of comparisons, search time, and lines processed.
             
@@ -32,22 +39,88 @@ class BoyerMoore(SearchAlgorithm):
         _find_suffix_length(pattern: str, p: int) -> int: Finds the length of the suffix.
         _is_prefix(pattern: str, p: int) -> bool: Checks if a substring is a prefix.
         _build_good_suffix_table(pattern: str) -> List[int]: Builds the good suffix table.
+        prepare_query(query: str) -> Tuple: Builds or fetches the cached shift tables.
         search(query: str) -> bool: Searches for the provided query string in the file.
         get_stats() -> dict: Returns statistics about the last search operation.
     """
-    def __init__(self, file_path: str, reread_on_query: bool = False, case_sensitive: bool = True):
+    def __init__(self, file_path: str, reread_on_query: bool = False, case_sensitive: bool = True,
+                 workers: int = 1):
         super().__init__(file_path)
         self.reread_on_query = reread_on_query
+        # A server already searches from several request threads, so one thread each by default
+        self.workers = workers
         self._stats = {
             "comparisons": 0,
-            "search_time": 0,
+            "search_time_ns": 0,
             "lines_processed": 0
         }
         self.case_sensitive = case_sensitive
+        self._packed = None
+        self._by_length = None
+        # Repeated queries reuse their tables; least recently used ones are evicted first
+        self._tables = lru_cache(maxsize=PATTERN_CACHE_SIZE)(self._build_tables)
         if not self.reread_on_query:
             self._read_file()
     
-    
+    def _read_file(self) -> None:
+        """
+        Loads the file lines and packs them for the JIT kernel when it is available.
+
+        The packed copy is only rebuilt when the underlying line cache was reloaded.
+        """
+        lines = self._lines
+        super()._read_file()
+        if self._lines is not lines or self._packed is None:
+            self._packed = bmh_njit.pack_lines(self._lines)
+            self._by_length = None
+
+    def _build_tables(self, query: str, compiled: bool) -> Tuple:
+        """
+        Builds the shift tables for a query.
+
+        Args:
+            query (str): The query, already lowercased for case-insensitive searches.
+            compiled (bool): Whether to build the encoded tables used by the JIT kernel.
+
+        Returns:
+            Tuple: The kernel inputs from `bmh_njit.shift_tables` when compiled,
+                otherwise the bad character table's `get` and the good suffix table.
+        """
+        if compiled:
+            pattern = query.encode('utf-8')
+            return bmh_njit.shift_tables(pattern, self._build_good_suffix_table(pattern))
+        return self._build_bad_char_table(query).get, self._build_good_suffix_table(query)
+
+    def prepare_query(self, query: str) -> Tuple:
+        """
+        Builds or fetches the cached shift tables for a query.
+
+        Args:
+            query (str): The query to prepare.
+
+        Returns:
+            Tuple: The tables used by `search` for this query.
+        """
+        if not self.case_sensitive:
+            query = query.lower()
+        return self._tables(query, self._packed is not None and bool(query))
+
+    @staticmethod
+    def _group_by_length(lines: Iterable[str]) -> Dict[int, List[str]]:
+        """
+        Groups lines by length, keeping their file order within each group.
+
+        Args:
+            lines (Iterable[str]): The lines to group.
+
+        Returns:
+            Dict[int, List[str]]: The lines of each length.
+        """
+        by_length: Dict[int, List[str]] = {}
+        for line in lines:
+            by_length.setdefault(len(line), []).append(line)
+        return by_length
+
     def _build_bad_char_table(self, pattern: str) -> dict:
         table = {}
         pattern_length = len(pattern)
@@ -92,35 +165,47 @@ class BoyerMoore(SearchAlgorithm):
         return table
     
     def search(self, query: str) -> bool:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         if not self.case_sensitive:
             query = query.lower()
         super().search(query)
         if self.reread_on_query:
             self._read_file()
         self._stats["comparisons"] = 0
-        self._stats["search_time"] = 0
-        bad_char_table = self._build_bad_char_table(query)
-        good_suffix_table = self._build_good_suffix_table(query)
-        for line_index, line in enumerate(self._lines):
-            if len(line) != len(query):
-                continue
-            i = len(query) - 1
-            while i < len(line):
-                j = len(query) - 1
+        self._stats["search_time_ns"] = 0
+        compiled = self._packed is not None and bool(query)
+        tables = self._tables(query, compiled)
+        if compiled:
+            # The same comparisons run compiled on the encoded lines, off the interpreter and
+            # split across threads for large files
+            found, comparisons = bmh_njit.match_lines(self._packed, tables, self.workers)
+            self._stats["comparisons"] = comparisons
+            self._stats["search_time_ns"] = time.perf_counter_ns() - start_time
+            return found
+        bad_char_get, good_suffix_table = tables
+        if self._by_length is None:
+            self._by_length = self._group_by_length(self._lines)
+        # Loop invariants live in locals, so the inner loops do no attribute or len() lookups
+        m = len(query)
+        comparisons = 0
+        # Only lines as long as the query can equal it, and they are looked up in one step
+        for line in self._by_length.get(m, ()):
+            i = m - 1
+            while i < m:
+                j = m - 1
                 k = i
                 while j >= 0 and line[k] == query[j]:
-                    self._stats["comparisons"] += 1
+                    comparisons += 1
                     k -= 1
                     j -= 1
                 if j == -1:
-                    self._stats["search_time"] = time.time() - start_time
+                    self._stats["comparisons"] = comparisons
+                    self._stats["search_time_ns"] = time.perf_counter_ns() - start_time
                     return True
-                self._stats["comparisons"] += 1
-                bad_char_shift = bad_char_table.get(line[k], len(query))
-                good_suffix_shift = good_suffix_table[len(query) - 1 - j]
-                i += max(bad_char_shift, good_suffix_shift)
-        self._stats["search_time"] = time.time() - start_time
+                comparisons += 1
+                i += max(bad_char_get(line[k], m), good_suffix_table[m - 1 - j])
+        self._stats["comparisons"] = comparisons
+        self._stats["search_time_ns"] = time.perf_counter_ns() - start_time
         return False
     
     def get_stats(self) -> dict:
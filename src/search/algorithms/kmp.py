@@ -2,9 +2,6 @@ import re
 import time
 import os
 from typing import Iterator, Dict, List, Optional, Set
-import mmh3
-from pybloom_live import BloomFilter
-import datrie
 from src.search.base import SearchAlgorithm
 
 class KMP(SearchAlgorithm):
@@ -36,7 +33,7 @@ class KMP(SearchAlgorithm):
         self.case_sensitive = case_sensitive
         self._stats = {
             "comparisons": 0,
-            "search_time": 0,
+            "search_time_ns": 0,
             "lines_processed": 0,
             "prefix_table_computations": 0
         }
@@ -50,8 +47,9 @@ class KMP(SearchAlgorithm):
         
         len_prev_lps = 0
         i = 1
+        computations = 0
         while i < length:
-            self._stats["prefix_table_computations"] += 1
+            computations += 1
             if pattern[i] == pattern[len_prev_lps]:
                 len_prev_lps += 1
                 lps[i] = len_prev_lps
@@ -62,6 +60,7 @@ class KMP(SearchAlgorithm):
                 lps[i] = 0
                 i += 1
         
+        self._stats["prefix_table_computations"] += computations
         return lps
     
     def _kmp_search(self, text: str, pattern: str) -> bool:
@@ -74,14 +73,17 @@ class KMP(SearchAlgorithm):
         
         i = 0  # Index for text
         j = 0  # Index for pattern
+        # Counted locally and stored once, so the loop does no dict writes
+        comparisons = 0
         
         while i < n:
-            self._stats["comparisons"] += 1
+            comparisons += 1
             
             if pattern[j] == text[i]:
                 i += 1
                 j += 1
             if j == m:
+                self._stats["comparisons"] += comparisons
                 return True
             elif i < n and pattern[j] != text[i]:
                 if j > 0:
@@ -89,16 +91,17 @@ class KMP(SearchAlgorithm):
                 else:
                     i += 1
         
+        self._stats["comparisons"] += comparisons
         return False
     
     def search(self, query: str) -> bool:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         super().search(query)
         if self.reread_on_query:
             self._read_file()
         
         self._stats["comparisons"] = 0
-        self._stats["search_time"] = 0
+        self._stats["search_time_ns"] = 0
         self._stats["prefix_table_computations"] = 0
         
         for line in self._lines:
@@ -107,7 +110,7 @@ class KMP(SearchAlgorithm):
                 query = query.lower()
             if self._kmp_search(line, query):
                 return True
-        self._stats["search_time"] = time.time() - start_time
+        self._stats["search_time_ns"] = time.perf_counter_ns() - start_time
         return False
     
     def get_stats(self) -> dict:
@@ -24,7 +24,7 @@ class RabinKarp(SearchAlgorithm):
         reread_on_query (bool): Flag indicating whether to reread the file on each query
         _lines (List[str]): Lines of the file stored for searching
         _stats (Dict): Dictionary tracking search statistics including comparisons,
-                    time elapsed, lines processed, and hash collisions
+                    search time in nanoseconds, lines processed, and hash collisions
         base (int): Base value for the polynomial hash function
         prime (int): Prime number used as modulus in hash calculations
 
@@ -41,14 +41,14 @@ class RabinKarp(SearchAlgorithm):
         >>> rk.search('pattern')
         True
         >>> rk.get_stats()
-        {'comparisons': 12, 'time_elapsed': 0.0005, 'lines_processed': 1000, 'hash_collisions': 0}
+        {'comparisons': 12, 'search_time_ns': 500000, 'lines_processed': 1000, 'hash_collisions': 0}
     """
     def __init__(self, file_path: str, reread_on_query: bool = False, base: int = 256, prime: int = 101, case_sensitive: bool = True) -> None:
         super().__init__(file_path)
         self.reread_on_query = reread_on_query
         self._stats = {
             "comparisons": 0,
-            "time_elapsed": 0,
+            "search_time_ns": 0,
             "lines_processed": 0,
             "hash_collisions": 0
         }
@@ -73,20 +73,22 @@ class RabinKarp(SearchAlgorithm):
         return new_hash
     
     def _check_strings(self, text: str, pattern: str, start: int) -> bool:
+        # The count follows from the loop index, so the loop does no dict writes
         for i in range(len(pattern)):
-            self._stats["comparisons"] += 1
             if text[start + i] != pattern[i]:
+                self._stats["comparisons"] += i + 1
                 return False
+        self._stats["comparisons"] += len(pattern)
         return True
     
     def search(self, query: str) -> bool:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         super().search(query)
         if self.reread_on_query:
             self._read_file()
         
         self._stats["comparisons"] = 0
-        self._stats["time_elapsed"] = 0
+        self._stats["search_time_ns"] = 0
         self._stats["hash_collisions"] = 0
         
         result = False
@@ -104,7 +106,7 @@ class RabinKarp(SearchAlgorithm):
                     return True
                 else:
                     self._stats["hash_collisions"] += 1
-        self._stats["time_elapsed"] = time.time() - start_time
+        self._stats["search_time_ns"] = time.perf_counter_ns() - start_time
         return result
     
     def get_stats(self) -> dict:
@@ -1,23 +1,23 @@
 import re
 import time
 import os
-from typing import Iterator, Dict, List, Optional, Set
-import mmh3
-from pybloom_live import BloomFilter
-import datrie
+from typing import Iterator, Dict, List, Optional, Set, Tuple
 from src.search.base import SearchAlgorithm
+from src.search.mapped import load_buffer
+from src.search.matcher import BMH
 
 class SimpleSearch(SearchAlgorithm):    
     """
-    A basic line-by-line search implementation optimized for sequential file scanning.
+    A basic sequential search implementation optimized for scanning an in-memory file buffer.
 
-    This class provides a straightforward search algorithm that reads the file line by line,
-    comparing each line directly with the query string. While simple in approach, it can be
-    efficient for small files or when memory usage needs to be minimized.
+    This class reads the file into a single buffer and locates the query with a single
+    Boyer-Moore-Horspool pass over it instead of iterating lines in Python.
+    Only the candidate matches are checked against line boundaries, so no per-line
+    string objects are created.
 
     Performance characteristics:
-        - Time complexity: O(n) where n is the number of lines
-        - Space complexity: O(1) with line-by-line processing
+        - Time complexity: O(n) where n is the size of the file in bytes
+        - Space complexity: O(1) beyond the file buffer
         - Best case: O(1) when match is found in first line
         - Worst case: O(n) when no match exists or match is in last line
 
@@ -31,16 +31,20 @@ class SimpleSearch(SearchAlgorithm):
     Attributes:
         stats (Dict): Performance statistics including:
             - comparisons: Number of line comparisons performed
-            - time_taken: Total search execution time in seconds
+            - search_time_ns: Total search execution time in nanoseconds
         _file_size (int): Size of the target file in bytes
         _buffer_size (int): Buffer size for file reading operations
+        _buffer (Optional[Buffer]): File content, lowercased when the search
+            is case-insensitive
+        _file_state (Optional[Tuple[int, int]]): Modification time and size of
+            the file when it was last read
         reread_on_query (bool): Flag controlling file rereading behavior
 
     Example:
         >>> searcher = SimpleSearch('data.txt')
         >>> found = searcher.search('example text')
         >>> print(searcher.get_stats())
-        {'comparisons': 42, 'time_taken': 0.0015}
+        {'comparisons': 42, 'search_time_ns': 1500000}
 
     Note:
         This implementation ensures exact matches only - no partial matches are returned.
@@ -48,22 +52,47 @@ class SimpleSearch(SearchAlgorithm):
     """
     def __init__(self, file_path: str, reread_on_query: bool = False, case_sensitive: bool = True) -> None:
         super().__init__(file_path)
-        self.stats = {"comparisons": 0, "time_taken": 0}
+        self.stats = {"comparisons": 0, "search_time_ns": 0}
         self._file_size = os.path.getsize(file_path)
         self._buffer_size = min(8192, self._file_size)  # Optimal buffer size for most filesystems
         self.reread_on_query = reread_on_query
         self.case_sensitive = case_sensitive
+        self._buffer = None
+        self._file_state: Optional[Tuple[int, int]] = None
         if not self.reread_on_query:
             self._read_file()
+
+    def _read_file(self) -> None:
+        """
+        Reads the target file into memory.
+
+        The content is only read again when the file modification time or size
+        changes. For case-insensitive searches a lowercased copy is kept instead.
+
+        Raises:
+            FileNotFoundError: If the target file does not exist.
+            RuntimeError: If file reading encounters an error.
+        """
+        try:
+            info = os.stat(self.file_path)
+            file_state = (info.st_mtime_ns, info.st_size)
+            if file_state == self._file_state:
+                return
+            self._buffer = load_buffer(self.file_path, self.case_sensitive)
+            self._file_state = file_state
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+        except Exception as e:
+            raise RuntimeError(f"Error reading file: {e}")
     
     def search(self, query: str) -> bool:
         """
-        Performs a line-by-line search for the query string.
+        Performs an in-memory scan for the query string.
 
         This method implements an exact matching algorithm that:
-        1. Converts the query to bytes for consistent comparison
-        2. Reads each line efficiently using buffered I/O
-        3. Performs exact matches only (no partial matches)
+        1. Converts the query to bytes once
+        2. Runs a single Boyer-Moore-Horspool pass over the whole buffer
+        3. Accepts an occurrence only if it spans a complete line
         4. Updates performance statistics
 
         Args:
@@ -78,26 +107,29 @@ class SimpleSearch(SearchAlgorithm):
             - Empty queries never match, even with empty lines
             - Performance statistics are updated after each search
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         if self.reread_on_query:
             self._read_file()
         self.stats["comparisons"] = 0
         
         # Handle empty query case
         if not query:
-            self.stats["time_taken"] = time.time() - start_time
+            self.stats["search_time_ns"] = time.perf_counter_ns() - start_time
+            return False
+
+        if not self.case_sensitive:
+            query = query.lower()
+        query = query.rstrip()
+        # A query spanning a newline would match consecutive lines of the buffer
+        if '\n' in query:
+            self.stats["search_time_ns"] = time.perf_counter_ns() - start_time
             return False
+        matcher = BMH(query.encode('utf-8'))
+        if matcher.find_line(self._buffer):
+            self.stats["search_time_ns"] = time.perf_counter_ns() - start_time
+            return True
 
-        for line in self._lines[:-1]:  # Exclude last line if empty
-            self.stats["comparisons"] += 1
-            if not self.case_sensitive:
-                # line = line.lower()
-                query = query.lower()
-            if line == query.rstrip():  # Compare without trailing newline
-                self.stats["time_taken"] = time.time() - start_time
-                return True
-                
-        self.stats["time_taken"] = time.time() - start_time
+        self.stats["search_time_ns"] = time.perf_counter_ns() - start_time
         return False
     
     def get_stats(self) -> dict:
@@ -107,7 +139,7 @@ class SimpleSearch(SearchAlgorithm):
         Returns:
             dict: A dictionary containing performance metrics:
                 - comparisons: Number of line comparisons performed
-                - time_taken: Total search execution time in seconds
+                - search_time_ns: Total search execution time in nanoseconds
 
         Note:
             Statistics are reset at the start of each search operation.
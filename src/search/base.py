@@ -1,5 +1,85 @@
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional, List
+from collections import OrderedDict
+from itertools import repeat
+from typing import Iterator, Optional, List, Tuple
+
+# Characters removed by bytes.rstrip(), kept so decoded lines are trimmed identically
+ASCII_WHITESPACE = " \t\n\r\x0b\x0c"
+
+
+def split_lines(data: bytes, case_sensitive: bool = True, errors: str = 'strict') -> Iterator[str]:
+    """
+    Decodes file content and splits it into trimmed lines.
+
+    The content is decoded (and lowercased) once as a whole; each line is then
+    trimmed in C, and `rstrip` hands back the same string when there is nothing
+    to strip, so a line costs a single allocation.
+
+    Args:
+        data (bytes): Raw file content.
+        case_sensitive (bool): When False, lines are lowercased.
+        errors (str): Error handling scheme passed to `bytes.decode`.
+
+    Returns:
+        Iterator[str]: The lines, without trailing whitespace.
+    """
+    text = data.decode('utf-8', errors=errors)
+    if not case_sensitive:
+        text = text.lower()
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return map(str.rstrip, lines, repeat(ASCII_WHITESPACE))
+
+
+# Decoded lines of recently read files, one version per (path, case mode), oldest first
+LINE_CACHE_SIZE = 8
+_line_cache: "OrderedDict[Tuple[str, bool], Tuple[Tuple[int, int], Tuple[str, ...]]]" = OrderedDict()
+_line_cache_lock = threading.Lock()
+
+
+def load_lines(file_path: str, case_sensitive: bool = True) -> Tuple[str, ...]:
+    """
+    Loads the trimmed lines of a file, shared by every instance reading it.
+
+    Algorithms built over the same corpus reuse one decoded copy of it for as
+    long as the file keeps its modification time and size. Only the latest
+    version of each file is kept, so an edited file replaces its old copy.
+
+    Args:
+        file_path (str): Path to the file to read.
+        case_sensitive (bool): When False, lines are lowercased.
+
+    Returns:
+        Tuple[str, ...]: The lines, without trailing whitespace.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    info = os.stat(file_path)
+    key = (file_path, case_sensitive)
+    state = (info.st_mtime_ns, info.st_size)
+    with _line_cache_lock:
+        cached = _line_cache.get(key)
+        if cached is not None and cached[0] == state:
+            _line_cache.move_to_end(key)
+            return cached[1]
+        # Release the outdated copy before decoding the new one
+        _line_cache.pop(key, None)
+
+    buffer_size = 8 * 1024 * 1024  # 8MB buffer for optimal I/O
+    with open(file_path, 'rb', buffering=buffer_size) as file:
+        data = file.read()
+    lines = tuple(split_lines(data, case_sensitive, errors='replace'))
+
+    with _line_cache_lock:
+        _line_cache[key] = (state, lines)
+        _line_cache.move_to_end(key)
+        while len(_line_cache) > LINE_CACHE_SIZE:
+            _line_cache.popitem(last=False)
+    return lines
 
 class SearchAlgorithm(ABC):
     """
@@ -15,7 +95,7 @@ class SearchAlgorithm(ABC):
     Attributes:
         file_path (str): Path to the target file.
         _last_modified (float): Timestamp of last file modification.
-        _lines (List[str]): Cached file content, if applicable.
+        _lines (Sequence[str]): Cached file content, if applicable.
         reread_on_query (bool): Whether to reread file content on each query.
 
     Note:
@@ -57,11 +137,27 @@ class SearchAlgorithm(ABC):
             self._read_file()
         pass
     
+    def prepare_query(self, query: str) -> None:
+        """
+        Precomputes any per-query state ahead of searching.
+
+        Algorithms that preprocess the query (compiled patterns, shift tables)
+        override this so callers can pay that cost once, outside timed loops.
+        The default implementation does nothing.
+
+        Args:
+            query (str): The query that will be searched for.
+        """
+        pass
+
     @abstractmethod
     def get_stats(self) -> dict:
         """
         Retrieves search operation statistics.
 
+        Every algorithm reports the duration of its last search under
+        `search_time_ns`, measured with `time.perf_counter_ns`.
+
         Returns:
             dict: A dictionary containing algorithm-specific performance metrics.
         """
@@ -74,15 +170,13 @@ class SearchAlgorithm(ABC):
         This implementation provides efficient file reading with:
             - File modification checking to avoid unnecessary reloads
             - Large buffer sizes for improved I/O performance
-            - UTF-8 decoding with error handling
-            - Memory-efficient line storage
+            - UTF-8 decoding of the whole file in a single pass
+            - One immutable line tuple shared by all instances reading the file
 
         Raises:
             FileNotFoundError: If the target file does not exist.
             RuntimeError: If file reading encounters an error.
         """
-        import os
-        
         try:
             current_mtime = os.path.getmtime(self.file_path)
             if self._lines and current_mtime <= self._last_modified:
@@ -92,14 +186,7 @@ class SearchAlgorithm(ABC):
             pass
                 
         try:
-            buffer_size = 8 * 1024 * 1024  # 8MB buffer for optimal I/O
-            with open(self.file_path, 'rb', buffering=buffer_size) as file:
-                if not self.case_sensitive:
-                    self._lines = [line.rstrip().decode('utf-8', errors='replace').lower() 
-                             for line in file]
-                else:
-                    self._lines = [line.rstrip().decode('utf-8', errors='replace') 
-                             for line in file]
+            self._lines = load_lines(self.file_path, self.case_sensitive)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {self.file_path}")
         except Exception as e:
@@ -0,0 +1,259 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+if TYPE_CHECKING:
+    from src.search.matcher import BMH
+
+NUMBA_AVAILABLE = njit is not None
+
+# Below this size a scan finishes before extra threads would pay for themselves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+# Size of the thread pool shared by every parallel scan
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide pool parallel scans run on, starting it on first use.
+
+    Concurrent searches queue their ranges on the same `MAX_WORKERS` threads
+    instead of each starting a pool of its own.
+
+    Returns:
+        ThreadPoolExecutor: The shared pool.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="bmh-scan")
+    return _executor
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def bmh_scan(buf, pat, bad, bloom, m, n):
+        """
+        Native Boyer-Moore-Horspool scan with the Sunday bloom shortcut.
+
+        Args:
+            buf (np.ndarray): uint8 view of the buffer to scan.
+            pat (np.ndarray): uint8 view of the pattern.
+            bad (np.ndarray): int32 bad character shift table.
+            bloom (np.uint64): 64-bit mask of the pattern bytes.
+            m (int): Length of the pattern, at least 1.
+            n (int): Length of the buffer.
+
+        Returns:
+            np.ndarray: int64 offsets of every occurrence, in increasing order.
+        """
+        out = np.empty(16, np.int64)
+        count = 0
+        last = pat[m - 1]
+        one = np.uint64(1)
+        i = 0
+        while i <= n - m:
+            c = buf[i + m - 1]
+            if c == last:
+                j = 0
+                while j < m - 1 and buf[i + j] == pat[j]:
+                    j += 1
+                if j == m - 1:
+                    if count == out.shape[0]:
+                        grown = np.empty(out.shape[0] * 2, np.int64)
+                        grown[:count] = out[:count]
+                        out = grown
+                    out[count] = i
+                    count += 1
+                    i += 1
+                    continue
+            if i + m < n and (bloom >> np.uint64(buf[i + m] & 63)) & one == 0:
+                i += m + 1
+            else:
+                i += bad[c]
+        return out[:count]
+
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def bm_match_lines(buf, starts, pat, bad, good, m):
+        """
+        Native Boyer-Moore comparison of the pattern against every line of equal length.
+
+        Args:
+            buf (np.ndarray): uint8 view of the lines concatenated without separators.
+            starts (np.ndarray): int64 start offset of every line, plus the end offset.
+            pat (np.ndarray): uint8 view of the pattern.
+            bad (np.ndarray): int32 bad character shift table.
+            good (np.ndarray): int32 good suffix shift table.
+            m (int): Length of the pattern, at least 1.
+
+        Returns:
+            Tuple[bool, int]: Whether a line equals the pattern, and the number of
+                byte comparisons performed.
+        """
+        comparisons = 0
+        for line in range(starts.shape[0] - 1):
+            lo = starts[line]
+            n = starts[line + 1] - lo
+            if n != m:
+                continue
+            i = m - 1
+            while i < n:
+                j = m - 1
+                k = i
+                while j >= 0 and buf[lo + k] == pat[j]:
+                    comparisons += 1
+                    k -= 1
+                    j -= 1
+                if j == -1:
+                    return True, comparisons
+                comparisons += 1
+                i += max(bad[buf[lo + k]], good[m - 1 - j])
+        return False, comparisons
+
+
+def warm_up() -> None:
+    """
+    Compiles, or loads from the cache, every kernel on tiny inputs.
+
+    Starting Numba and LLVM costs tens of megabytes and some hundred milliseconds
+    once per process, so callers that measure a search can pay for it up front.
+    Does nothing when Numba is unavailable.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    from src.search.matcher import BMH
+    scan(b"ab\n", BMH(b"b"))
+    match_lines(pack_lines(["ab"]), shift_tables(b"ab", [1, 2]))
+
+
+def pack_lines(lines: Sequence[str]) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+    """
+    Encodes lines into one contiguous byte array for the JIT kernels.
+
+    Args:
+        lines (Sequence[str]): The lines to pack.
+
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray]]: The uint8 concatenation of the
+            UTF-8 encoded lines and the int64 start offset of every line followed
+            by the total length, or None if Numba is unavailable.
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    encoded = [line.encode('utf-8') for line in lines]
+    starts = np.zeros(len(encoded) + 1, np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), np.int64, len(encoded)), out=starts[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), starts
+
+
+def shift_tables(pattern: bytes, good_suffix: Sequence[int]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Converts a pattern and its good suffix table into `bm_match_lines` inputs.
+
+    Args:
+        pattern (bytes): The non-empty pattern to look for.
+        good_suffix (Sequence[int]): Good suffix shift table of the pattern.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The uint8 pattern, its int32 bad
+            character table and its int32 good suffix table.
+    """
+    m = len(pattern)
+    pat = np.frombuffer(pattern, dtype=np.uint8)
+    bad = np.full(256, m, np.int32)
+    for j in range(m - 1):
+        bad[pat[j]] = m - 1 - j
+    return pat, bad, np.asarray(good_suffix, np.int32)
+
+
+def match_lines(packed: Tuple["np.ndarray", "np.ndarray"],
+                tables: Tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+                workers: int = 1) -> Tuple[bool, int]:
+    """
+    Checks whether a pattern equals one of the packed lines with the JIT kernel.
+
+    Large inputs are split into `workers` line ranges compared concurrently on
+    the shared pool, as `scan` does. Every range is then compared in full, so the
+    comparison count is the total over all ranges.
+
+    Args:
+        packed (Tuple[np.ndarray, np.ndarray]): Lines packed by `pack_lines`.
+        tables (Tuple[np.ndarray, np.ndarray, np.ndarray]): Pattern tables built by
+            `shift_tables`.
+        workers (int): Number of ranges to compare concurrently, at most `MAX_WORKERS`.
+
+    Returns:
+        Tuple[bool, int]: Whether a line equals the pattern, and the number of
+            byte comparisons performed.
+    """
+    buf, starts = packed
+    pat, bad, good = tables
+    m = pat.shape[0]
+    workers = min(workers, MAX_WORKERS)
+    count = starts.shape[0] - 1
+    if workers <= 1 or buf.shape[0] < PARALLEL_MIN_BYTES or count < workers:
+        found, comparisons = bm_match_lines(buf, starts, pat, bad, good, m)
+        return bool(found), int(comparisons)
+
+    step = -(-count // workers)
+
+    def match_range(lo):
+        # Offsets are absolute, so a range only needs its slice of the start offsets
+        return bm_match_lines(buf, starts[lo:lo + step + 1], pat, bad, good, m)
+
+    parts = list(_shared_executor().map(match_range, range(0, count, step)))
+    return any(found for found, _ in parts), sum(int(comparisons) for _, comparisons in parts)
+
+
+def scan(buf, matcher: "BMH", workers: int = 1) -> Optional["np.ndarray"]:
+    """
+    Finds every occurrence of the matcher's pattern with the JIT compiled kernel.
+
+    The kernel runs without the GIL, so large buffers are split into byte ranges
+    scanned concurrently on the shared pool, sharing the same memory. Each range
+    is extended by `m - 1` bytes, so occurrences straddling a boundary are found
+    exactly once, by the range they start in.
+
+    Args:
+        buf: A buffer exposing the buffer protocol (bytes, mmap).
+        matcher (BMH): The preprocessed matcher for the pattern.
+        workers (int): Number of ranges to scan concurrently, at most `MAX_WORKERS`.
+
+    Returns:
+        Optional[np.ndarray]: Match offsets, or None if Numba is unavailable or the
+            pattern is empty.
+    """
+    if not NUMBA_AVAILABLE or matcher.m == 0 or len(buf) == 0:
+        return None
+    m = matcher.m
+    bad = np.full(256, m, np.int32)
+    pattern = np.frombuffer(matcher.pattern, dtype=np.uint8)
+    for j in range(m - 1):
+        bad[pattern[j]] = m - 1 - j
+    bloom = np.uint64(matcher.bloom)
+    data = np.frombuffer(buf, dtype=np.uint8)
+    n = data.shape[0]
+    workers = min(workers, MAX_WORKERS)
+    if workers <= 1 or n < PARALLEL_MIN_BYTES:
+        return bmh_scan(data, pattern, bad, bloom, m, n)
+
+    step = -(-n // workers)
+
+    def scan_range(lo):
+        hi = min(n, lo + step + m - 1)
+        return bmh_scan(data[lo:hi], pattern, bad, bloom, m, hi - lo) + lo
+
+    parts = list(_shared_executor().map(scan_range, range(0, n, step)))
+    return np.concatenate(parts)
@@ -0,0 +1,132 @@
+from array import array
+from bisect import bisect_right
+from typing import Iterator, Optional, Sequence, Tuple
+from src.search.base import ASCII_WHITESPACE
+
+Buffer = bytes
+
+
+def load_buffer(file_path: str, case_sensitive: bool = True) -> Buffer:
+    """
+    Reads a whole file into a single immutable buffer.
+
+    The content is copied rather than mapped: a mapping would fault (SIGBUS) as
+    soon as the file is truncated or rewritten in place, and would no longer be a
+    snapshot of the file as it was read.
+
+    Args:
+        file_path (str): Path to the file to read.
+        case_sensitive (bool): When False, a lowercased copy of the content is
+            returned.
+
+    Returns:
+        Buffer: The file content, or an empty bytes object for empty files.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(file_path, 'rb', buffering=0) as file:
+        content = file.readall()
+    if not case_sensitive:
+        # ASCII content lowers the same as bytes, without the decode/encode round trip
+        if content.isascii():
+            return content.lower()
+        return content.decode('utf-8', errors='replace').lower().encode('utf-8')
+    return content
+
+
+def line_offsets(buffer: Buffer) -> array:
+    """
+    Computes the start offset of every line of a buffer.
+
+    Args:
+        buffer (Buffer): Newline separated content.
+
+    Returns:
+        array: Signed 64-bit start offsets, one per line.
+    """
+    offsets = array('q')
+    size = len(buffer)
+    if size:
+        offsets.append(0)
+    pos = buffer.find(b"\n") + 1
+    while 0 < pos < size:
+        offsets.append(pos)
+        pos = buffer.find(b"\n", pos) + 1
+    return offsets
+
+
+class MappedLines(Sequence[str]):
+    """
+    Read-only list of lines backed by a file buffer and an offsets array.
+
+    Lines are decoded on access only, so the memory footprint is the buffer itself
+    plus eight bytes per line instead of one Python string per line. The offsets
+    are indexed on first use, so a buffer that is only scanned as a whole never
+    pays for them.
+
+    Args:
+        buffer (Buffer): Newline separated content.
+        offsets (Optional[array]): Precomputed line start offsets.
+
+    Attributes:
+        buffer (Buffer): The underlying content.
+        offsets (array): Start offset of every line.
+    """
+    def __init__(self, buffer: Buffer, offsets: Optional[array] = None) -> None:
+        self.buffer = buffer
+        self._offsets = offsets
+
+    @property
+    def offsets(self) -> array:
+        if self._offsets is None:
+            self._offsets = line_offsets(self.buffer)
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start, end = self.span(index)
+        # Decode straight from the buffer, so a line costs a single allocation
+        line = str(memoryview(self.buffer)[start:end], 'utf-8', 'replace')
+        return line.rstrip(ASCII_WHITESPACE)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self.offsets)):
+            yield self[index]
+
+    def span(self, index: int) -> Tuple[int, int]:
+        """
+        Returns the byte range of a line, excluding its newline.
+
+        Args:
+            index (int): Line number, negative values count from the end.
+
+        Returns:
+            Tuple[int, int]: Start and end offsets of the line.
+        """
+        offsets = self.offsets
+        if index < 0:
+            index += len(offsets)
+        if not 0 <= index < len(offsets):
+            raise IndexError("line index out of range")
+        start = offsets[index]
+        end = offsets[index + 1] - 1 if index + 1 < len(offsets) else len(self.buffer)
+        if end > start and self.buffer[end - 1:end] == b"\n":
+            end -= 1
+        return start, end
+
+    def line_of(self, offset: int) -> int:
+        """
+        Returns the number of the line containing a byte offset.
+
+        Args:
+            offset (int): Offset into the buffer.
+
+        Returns:
+            int: Index of the line containing the offset.
+        """
+        return bisect_right(self.offsets, offset) - 1
@@ -0,0 +1,190 @@
+from array import array
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+from src.search import bmh_njit
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class BMH:
+    """
+    Boyer-Moore-Horspool matcher with a Sunday bloom shortcut.
+
+    The shift table and the bloom mask are computed once per pattern, so a single
+    matcher can scan a whole file buffer in one pass instead of testing every line
+    separately. After a mismatch the byte following the window is checked against
+    the bloom mask; when it cannot occur in the pattern the window jumps past it,
+    as CPython's `default_find` does.
+
+    Args:
+        pattern (bytes): The byte string to search for.
+
+    Attributes:
+        pattern (bytes): The pattern being searched for.
+        m (int): Length of the pattern.
+        bad_char (array): 256-entry bad character shift table.
+        bloom (int): 64-bit mask of the pattern bytes (bit `c & 63` per byte).
+    """
+    def __init__(self, pattern: bytes) -> None:
+        self.pattern = pattern
+        self.m = m = len(pattern)
+        self.bad_char = array('i', [m] * 256)
+        for j in range(m - 1):
+            self.bad_char[pattern[j]] = m - 1 - j
+        self.bloom = 0
+        for c in pattern:
+            self.bloom |= 1 << (c & 63)
+
+    def bloom_contains(self, c: int) -> bool:
+        """
+        Checks whether a byte may occur in the pattern.
+
+        Args:
+            c (int): The byte value to check.
+
+        Returns:
+            bool: False if the byte is definitely not in the pattern.
+        """
+        return (self.bloom >> (c & 63)) & 1 == 1
+
+    def search(self, buf: Buffer, start: int = 0) -> Iterator[int]:
+        """
+        Scans the buffer and yields the offset of every occurrence of the pattern.
+
+        Args:
+            buf (Buffer): The buffer to scan, indexable by byte.
+            start (int): Offset to start scanning from.
+
+        Yields:
+            int: Offset of each occurrence, in increasing order.
+        """
+        m = self.m
+        n = len(buf)
+        if m == 0:
+            yield from range(start, n + 1)
+            return
+        pattern = self.pattern
+        last = pattern[m - 1]
+        bad_char = self.bad_char
+        bloom = self.bloom
+        i = start
+        while i <= n - m:
+            c = buf[i + m - 1]
+            if c == last and buf[i:i + m - 1] == pattern[:m - 1]:
+                yield i
+                i += 1
+                continue
+            if i + m < n and not (bloom >> (buf[i + m] & 63)) & 1:
+                i += m + 1
+            else:
+                i += bad_char[c]
+
+    def find(self, buf: Buffer, start: int = 0) -> int:
+        """
+        Returns the offset of the next occurrence of the pattern.
+
+        Buffers that provide a native `find` (bytes, mmap) are scanned in C, where
+        CPython runs the same Horspool/bloom scheme; other buffers use `search`.
+
+        Args:
+            buf (Buffer): The buffer to scan.
+            start (int): Offset to start scanning from.
+
+        Returns:
+            int: Offset of the occurrence, or -1 if there is none.
+        """
+        native_find = getattr(buf, 'find', None)
+        if native_find is not None:
+            return native_find(self.pattern, start)
+        return next(self.search(buf, start), -1)
+
+    def find_all(self, buf: Buffer, workers: int = 1) -> Sequence[int]:
+        """
+        Returns the offsets of every occurrence of the pattern in one pass.
+
+        The JIT compiled kernel is used when Numba is installed, otherwise the
+        occurrences are collected with `find`.
+
+        Args:
+            buf (Buffer): The buffer to scan.
+            workers (int): Number of threads the JIT kernel may split the scan over.
+
+        Returns:
+            Sequence[int]: Offsets of each occurrence, in increasing order.
+        """
+        offsets = bmh_njit.scan(buf, self, workers)
+        if offsets is not None:
+            return offsets
+        offsets = []
+        pos = self.find(buf, 0)
+        while pos != -1:
+            offsets.append(pos)
+            pos = self.find(buf, pos + 1)
+        return offsets
+
+    def find_line(self, buf: Buffer, candidates: Optional[Iterable[int]] = None,
+                  workers: int = 1) -> bool:
+        """
+        Checks whether the pattern matches a complete line of the buffer.
+
+        Lines are separated by `\\n`; trailing whitespace at the end of a line is
+        ignored, matching the `rstrip` applied when lines are read.
+
+        Args:
+            buf (Buffer): Newline separated file content.
+            candidates (Optional[Iterable[int]]): Precomputed occurrence offsets in
+                increasing order. When omitted, all offsets are enumerated in one
+                shot with `find_all` if the JIT kernel is available, otherwise the
+                buffer is scanned line by line with `find`.
+            workers (int): Number of threads used to enumerate the offsets.
+
+        Returns:
+            bool: True if some line equals the pattern, False otherwise.
+        """
+        size = len(buf)
+        if candidates is None and bmh_njit.NUMBA_AVAILABLE and self.m:
+            candidates = self.find_all(buf, workers)
+        if candidates is not None:
+            next_line = 0
+            for pos in candidates:
+                if pos < next_line:
+                    continue
+                if pos >= size:
+                    break
+                matched, line_end = self._match_line(buf, int(pos), size)
+                if matched:
+                    return True
+                next_line = line_end + 1
+            return False
+
+        pos = self.find(buf, 0)
+        while -1 < pos < size:
+            matched, line_end = self._match_line(buf, pos, size)
+            if matched:
+                return True
+            # Any other full-line match must begin after the current line
+            pos = self.find(buf, line_end + 1)
+        return False
+
+    def _match_line(self, buf: Buffer, pos: int, size: int) -> Tuple[bool, int]:
+        """
+        Checks whether the occurrence at `pos` spans a complete line.
+
+        Args:
+            buf (Buffer): Newline separated file content.
+            pos (int): Offset of an occurrence of the pattern.
+            size (int): Length of the buffer.
+
+        Returns:
+            Tuple[bool, int]: Whether the occurrence is a full-line match, and the
+                offset of the end of the line containing it.
+        """
+        end = pos + self.m
+        line_end = NEWLINE.find(buf, end)
+        if line_end == -1:
+            line_end = size
+        # Only an occurrence starting a line and followed by trailing whitespace is a full-line match
+        matched = (pos == 0 or buf[pos - 1] == 0x0A) and not bytes(buf[end:line_end]).strip()
+        return matched, line_end
+
+
+NEWLINE = BMH(b"\n")
@@ -339,6 +339,100 @@ def test_case_sensitivity(test_data_file, search_algo_info):
     assert search_no_case_sensitive.search("banana") is True
 
 
+def test_loaded_lines_are_shared(test_data_file):
+    """Algorithms reading the same unchanged file share one decoded copy"""
+    test_file, _ = test_data_file
+    from src.search.algorithms.binary import BinarySearch
+    from src.search.algorithms.kmp import KMP
+
+    lines = KMP(test_file)._lines
+    assert BinarySearch(test_file)._lines is lines
+    assert KMP(test_file, case_sensitive=False)._lines is not lines
+
+    with open(test_file, 'a', encoding='utf-8') as f:
+        f.write("kiwi\n")
+    assert "kiwi" in KMP(test_file)._lines
+
+    # An edited file replaces its previous copy instead of adding another one
+    from src.search.base import _line_cache
+    assert [key for key in _line_cache if key[0] == test_file] == [
+        (test_file, False), (test_file, True)
+    ]
+
+
+class TestSimpleSearch:
+    def test_full_line_matches_only(self, test_data_file):
+        """Test that SimpleSearch only accepts occurrences spanning a whole line"""
+        _, temp_dir = test_data_file
+        from src.search.algorithms.simple import SimpleSearch
+        
+        partial_file = os.path.join(temp_dir, "partial.txt")
+        with open(partial_file, 'w', encoding='utf-8') as f:
+            f.write("PARTIAL_MATCH_TEST\nTHIS_IS_A_TEST\nTESTING_PARTIAL_MATCHES")
+        
+        search = SimpleSearch(partial_file)
+        assert search.search("PARTIAL") is False
+        assert search.search("TEST") is False
+        assert search.search("THIS_IS_A_TEST") is True
+        assert search.search("TESTING_PARTIAL_MATCHES") is True
+        assert search.search("PARTIAL_MATCH_TEST\nTHIS_IS_A_TEST") is False
+    
+    def test_case_insensitive_and_empty_file(self, test_data_file):
+        """Test SimpleSearch case folding and empty files"""
+        test_file, temp_dir = test_data_file
+        from src.search.algorithms.simple import SimpleSearch
+        
+        search = SimpleSearch(test_file, case_sensitive=False)
+        assert search.search("HONEYDEW") is True
+        assert search.search("Apple") is True
+        
+        empty_file = os.path.join(temp_dir, "empty.txt")
+        with open(empty_file, 'wb') as f:
+            pass
+        assert SimpleSearch(empty_file).search("anything") is False
+
+    def test_file_rewritten_between_searches(self, test_data_file):
+        """Test that SimpleSearch survives the file being truncated and rewritten in place"""
+        _, temp_dir = test_data_file
+        from src.search.algorithms.simple import SimpleSearch
+
+        data_file = os.path.join(temp_dir, "rewritten.txt")
+        with open(data_file, 'w', encoding='utf-8') as f:
+            f.write("first\n" * 5000 + "last\n")
+        snapshot = SimpleSearch(data_file)
+        reread = SimpleSearch(data_file, reread_on_query=True)
+        assert snapshot.search("last") is True
+        assert reread.search("last") is True
+
+        with open(data_file, 'w', encoding='utf-8') as f:
+            f.write("fresh\n")
+        assert snapshot.search("last") is True
+        assert reread.search("last") is False
+        assert reread.search("fresh") is True
+
+
+class TestBMH:
+    def test_search_offsets(self):
+        """Test that the matcher yields every occurrence, including overlaps"""
+        from src.search.matcher import BMH
+        
+        matcher = BMH(b"ana")
+        assert list(matcher.search(b"banana bandana")) == [1, 3, 11]
+        assert list(matcher.search(memoryview(b"banana"))) == [1, 3]
+        assert matcher.find(b"xyz") == -1
+        assert list(matcher.find_all(b"banana bandana")) == [1, 3, 11]
+    
+    def test_find_line(self):
+        """Test full-line matching over a newline separated buffer"""
+        from src.search.matcher import BMH
+        
+        buffer = b"apple\npineapple\nbanana  \n"
+        assert BMH(b"apple").find_line(buffer) is True
+        assert BMH(b"banana").find_line(buffer) is True
+        assert BMH(b"pine").find_line(buffer) is False
+        assert BMH(b"anything").find_line(b"") is False
+
+
 class TestBinarySearch:
     def test_search_comparisons(self, test_data_file):
         """BinarySearch specific test for comparison counting"""
@@ -360,7 +454,9 @@ class TestBloomFilterSearch:
             for i in range(10000):
                 f.write(f"word_{i}\n".encode('utf-8'))
         
-        search = BloomFilterSearch(large_file, error_rate=0.01)
+        search = BloomFilterSearch(large_file, error_rate=0.01, exact=False)
+        assert search._lines == frozenset()
+        assert all(search.search(f"word_{i}") for i in range(0, 10000, 97))
         
         false_positives = 0
         tests = 1000
@@ -371,6 +467,30 @@ class TestBloomFilterSearch:
         false_positive_rate = false_positives / tests
         assert false_positive_rate < 0.02
 
+    def test_exact_mode_builds_no_filter(self, test_data_file):
+        """The default exact mode answers from the line set alone"""
+        test_file, _ = test_data_file
+        from src.search.algorithms.bloomfilter import BloomFilterSearch
+
+        search = BloomFilterSearch(test_file)
+        assert search._bloom is None
+        assert search.search("apple") is True
+        assert search.search("appl") is False
+
+    def test_unmatchable_query_skips_reread(self, test_data_file, monkeypatch):
+        """Queries that can never equal a stored line are rejected without reading"""
+        test_file, _ = test_data_file
+        from src.search.algorithms.bloomfilter import BloomFilterSearch
+
+        search = BloomFilterSearch(test_file, reread_on_query=True)
+        assert search.search("apple")
+
+        def fail_read():
+            raise AssertionError("file was reread")
+        monkeypatch.setattr(search, "_read_file", fail_read)
+        assert not search.search("apple ")
+        assert not search.search("apple\nbanana")
+
 
 class TestBoyerMoore:
     def test_boyer_moore_specific_behavior(self, test_data_file):
@@ -456,6 +576,36 @@ class TestBoyerMoore:
         assert bm.search("THIS_IS_A_TEST") is True
         assert bm.search("TESTING_PARTIAL_MATCHES") is True
 
+    def test_jit_kernel_matches_python_loop(self, test_data_file):
+        """The compiled path agrees with the interpreted one, comparisons included"""
+        _, temp_dir = test_data_file
+        from src.search import bmh_njit
+        from src.search.algorithms.boyermoore import BoyerMoore
+        if not bmh_njit.NUMBA_AVAILABLE:
+            pytest.skip("Numba is not installed")
+
+        pattern_file = os.path.join(temp_dir, "pattern_test.txt")
+        with open(pattern_file, 'w', encoding='utf-8') as f:
+            f.write("ABACADABRAC\nTESTTESTTEST\nMISSISSIPPI\nABCDEFGHIJKL")
+
+        jit = BoyerMoore(pattern_file)
+        interpreted = BoyerMoore(pattern_file)
+        interpreted._packed = None
+        for query in ["MISSISSIPPI", "MISSISSIPPA", "TESTTESTTESX", "ABACADABRA"]:
+            assert jit.search(query) == interpreted.search(query)
+            assert jit.get_stats()["comparisons"] == interpreted.get_stats()["comparisons"]
+
+    def test_shift_tables_cached(self, test_data_file):
+        """Test that repeated queries reuse their shift tables"""
+        test_file, _ = test_data_file
+        from src.search.algorithms.boyermoore import BoyerMoore
+
+        bm = BoyerMoore(test_file, case_sensitive=False)
+        assert bm.search("Apple") is True
+        tables = bm.prepare_query("APPLE")
+        assert bm.search("apple") is True
+        assert bm.prepare_query("apple") is tables
+
 
 class TestHashSearch:
     def test_hash_search_specific_behavior(self, test_data_file):
@@ -555,6 +705,20 @@ class TestHashSearch:
             assert search.search(r"^.*berry$") is True, "Pattern matching '.*berry' should return True"
 
 
+class TestRegexSearch:
+    def test_pattern_cache_reuse(self, test_data_file):
+        """Test that repeated queries reuse the preprocessed matcher"""
+        test_file, _ = test_data_file
+        from src.search.algorithms.regex import RegexSearch
+        
+        search = RegexSearch(test_file)
+        assert search.search("cherry") is True
+        matcher = search.prepare_query("cherry")
+        assert search.search("cherry") is True
+        assert RegexSearch(test_file).prepare_query("cherry") is matcher
+        assert search.search("cherr") is False
+
+
 class TestInMemorySearch:
     def test_inmemory_search(self, test_data_file):
         """Test InMemorySearch behavior"""
@@ -565,6 +729,53 @@ class TestInMemorySearch:
         assert search.search("apple") is True
         assert search.search("kiwi") is False
 
+    def test_full_line_membership_only(self, test_data_file):
+        """Test that queries spanning lines or carrying trailing whitespace never match"""
+        _, temp_dir = test_data_file
+        from src.search.algorithms.inmemory import InMemorySearch
+
+        data_file = os.path.join(temp_dir, "whitespace.txt")
+        with open(data_file, 'w', encoding='utf-8') as f:
+            f.write("foo\t\nbar\nbaz\n")
+        search = InMemorySearch(data_file)
+        assert search.search("foo") is True
+        assert search.search("foo\t") is False
+        assert search.search("bar ") is False
+        assert search.search("bar\nbaz") is False
+    
+    def test_mapped_lines(self, test_data_file):
+        """Test that lines are decoded on demand from the file buffer"""
+        test_file, _ = test_data_file
+        from src.search.algorithms.inmemory import InMemorySearch
+        
+        search = InMemorySearch(test_file)
+        assert search.search("banana") is True
+        assert search._lines._offsets is None
+        assert search._lines[0] == "apple"
+        assert search._lines[-1] == "honeydew"
+        assert search._lines.line_of(len("apple\nban")) == 1
+
+    def test_file_rewritten_between_searches(self, test_data_file):
+        """Test that rewriting the file in place neither crashes nor leaks into a snapshot"""
+        _, temp_dir = test_data_file
+        from src.search.algorithms.inmemory import InMemorySearch
+
+        data_file = os.path.join(temp_dir, "rewritten.txt")
+        with open(data_file, 'w', encoding='utf-8') as f:
+            f.write("first\n" * 5000 + "last\n")
+        snapshot = InMemorySearch(data_file)
+        reread = InMemorySearch(data_file, reread_on_query=True)
+        assert snapshot.search("last") is True
+        assert reread.search("last") is True
+
+        # Truncated and rewritten in place, as a data refresh does
+        with open(data_file, 'w', encoding='utf-8') as f:
+            f.write("fresh\n")
+        assert snapshot.search("last") is True
+        assert snapshot.search("fresh") is False
+        assert reread.search("last") is False
+        assert reread.search("fresh") is True
+
 
 class TestKMP:
     def test_kmp_specific_behavior(self, test_data_file):
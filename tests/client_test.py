@@ -1,7 +1,9 @@
+import asyncio
+import io
 import pytest
 import socket
 import ssl
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock, call
 from src.client import SearchClient
 from typing import Generator
 
@@ -47,6 +49,15 @@ def ssl_client_with_cert() -> SearchClient:
     return SearchClient(host="localhost", port=8443, use_ssl=True)
 
 
+def plain_socket() -> MagicMock:
+    """
+    Creates a mock plain socket whose `sendmsg` sends every buffer in full.
+    """
+    sock = MagicMock()
+    sock.sendmsg.side_effect = lambda buffers: sum(map(len, buffers))
+    return sock
+
+
 def test_client_initialization() -> None:
     """
     Test the initialization of the SearchClient class.
@@ -67,10 +78,43 @@ def test_create_connection_basic(basic_client: SearchClient, mock_socket: MagicM
     sock = basic_client.create_connection()
 
     mock_socket.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
-    mock_socket_instance.connect.assert_called_once_with(("localhost", 8443))
+    mock_socket_instance.connect.assert_called_once_with(("127.0.0.1", 8443))
     assert sock == mock_socket_instance
 
 
+def test_create_connection_socket_options(mock_socket: MagicMock) -> None:
+    """
+    Test that new sockets get the low-latency TCP options and the client timeout.
+    """
+    client = SearchClient(host="localhost", port=8443, use_ssl=False, timeout=2.5)
+    mock_socket_instance = mock_socket.return_value
+
+    client.create_connection()
+
+    mock_socket_instance.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    mock_socket_instance.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    mock_socket_instance.settimeout.assert_called_once_with(2.5)
+
+
+def test_create_connection_caches_address(basic_client: SearchClient, mock_socket: MagicMock) -> None:
+    """
+    Test that the hostname is resolved once, and again after a failed connect.
+    """
+    mock_socket_instance = mock_socket.return_value
+
+    with patch('socket.getaddrinfo', wraps=socket.getaddrinfo) as mock_getaddrinfo:
+        basic_client.create_connection()
+        basic_client.create_connection()
+        assert mock_getaddrinfo.call_count == 1
+
+        mock_socket_instance.connect.side_effect = ConnectionRefusedError
+        with pytest.raises(ConnectionRefusedError):
+            basic_client.create_connection()
+        mock_socket_instance.connect.side_effect = None
+        basic_client.create_connection()
+        assert mock_getaddrinfo.call_count == 2
+
+
 def test_create_connection_ssl(ssl_client: SearchClient, mock_socket: MagicMock, mock_ssl_context: MagicMock) -> None:
     """
     Test creating a connection with SSL enabled.
@@ -90,10 +134,82 @@ def test_create_connection_ssl(ssl_client: SearchClient, mock_socket: MagicMock,
     assert mock_ssl_instance.minimum_version == ssl.TLSVersion.TLSv1_2
     assert mock_ssl_instance.maximum_version == ssl.TLSVersion.TLSv1_3
     mock_ssl_instance.wrap_socket.assert_called_once_with(mock_socket_instance, server_hostname="localhost")
-    mock_wrapped_socket.connect.assert_called_once_with(("localhost", 8443))
+    mock_wrapped_socket.connect.assert_called_once_with(("127.0.0.1", 8443))
     assert sock == mock_wrapped_socket
 
 
+def test_search_reuses_connection(basic_client: SearchClient) -> None:
+    """
+    Test that consecutive searches share one connection.
+    """
+    mock_sock = plain_socket()
+    mock_sock.makefile.return_value = io.BytesIO(b"STRING EXISTS\nSTRING NOT FOUND\n")
+
+    with patch.object(basic_client, 'create_connection', return_value=mock_sock) as mock_create:
+        assert basic_client.search("query1") == "STRING EXISTS"
+        assert basic_client.search("query2") == "STRING NOT FOUND"
+
+    mock_create.assert_called_once()
+    assert mock_sock.sendmsg.call_count == 2
+    basic_client.close()
+    mock_sock.close.assert_called_once()
+
+
+def test_search_reconnects_after_server_close(basic_client: SearchClient) -> None:
+    """
+    Test that a query is resent over a new connection when the old one was closed.
+    """
+    stale_sock = plain_socket()
+    stale_sock.makefile.return_value = io.BytesIO(b"STRING EXISTS\n")
+    fresh_sock = plain_socket()
+    fresh_sock.makefile.return_value = io.BytesIO(b"STRING NOT FOUND\n")
+
+    with patch.object(basic_client, 'create_connection', side_effect=[stale_sock, fresh_sock]):
+        assert basic_client.search("query1") == "STRING EXISTS"
+        assert basic_client.search("query2") == "STRING NOT FOUND"
+
+    stale_sock.close.assert_called_once()
+    fresh_sock.sendmsg.assert_called_once_with([b"query2", b"\n"])
+
+
+def test_send_line_completes_partial_send() -> None:
+    """
+    Test that the rest of a line is sent when sendmsg sends only part of it.
+    """
+    mock_sock = MagicMock()
+    mock_sock.sendmsg.return_value = 3
+
+    SearchClient._send_line(mock_sock, b"query")
+
+    mock_sock.sendall.assert_called_once_with(b"ry\n")
+
+
+def test_ssl_context_is_reused(ssl_client: SearchClient, mock_socket: MagicMock, mock_ssl_context: MagicMock) -> None:
+    """
+    Test that the SSL context is built once and shared by later connections.
+    """
+    ssl_client.create_connection()
+    ssl_client.create_connection()
+
+    mock_ssl_context.assert_called_once_with(ssl.PROTOCOL_TLS_CLIENT)
+    assert mock_ssl_context.return_value.wrap_socket.call_count == 2
+
+
+def test_tls_session_is_resumed(ssl_client: SearchClient, mock_socket: MagicMock, mock_ssl_context: MagicMock) -> None:
+    """
+    Test that a new connection offers the TLS session of the previous one.
+    """
+    wrap_socket = mock_ssl_context.return_value.wrap_socket
+    wrap_socket.return_value = MagicMock(spec=ssl.SSLSocket)
+    session = wrap_socket.return_value.session
+
+    ssl_client.create_connection()
+    ssl_client.create_connection()
+
+    assert "session" not in wrap_socket.call_args_list[0].kwargs
+    assert wrap_socket.call_args_list[1].kwargs["session"] is session
+
+
 def test_run_concurrent_searches(capsys: pytest.CaptureFixture, basic_client: SearchClient) -> None:
     """
     Test running concurrent searches with multiple queries.
@@ -114,6 +230,58 @@ def test_run_concurrent_searches(capsys: pytest.CaptureFixture, basic_client: Se
         assert "Query 'query3' generated an exception: test error" in output
 
 
+def test_run_concurrent_searches_closes_connections(basic_client: SearchClient) -> None:
+    """
+    Test that each worker closes its connection once the queries run out.
+    """
+    sock, reader = plain_socket(), MagicMock()
+    reader.readline.return_value = b"STRING EXISTS\n"
+    sock.makefile.return_value = reader
+
+    with patch.object(basic_client, 'create_connection', return_value=sock):
+        from src.client import run_concurrent_searches
+        run_concurrent_searches(basic_client, ["query1", "query2"], num_threads=1)
+
+    sock.close.assert_called_once()
+    reader.close.assert_called_once()
+    assert basic_client._connections == []
+
+
+def test_search_many(basic_client: SearchClient, mock_socket: MagicMock) -> None:
+    """
+    Test that a batch of queries is answered in order over one connection.
+    """
+    mock_socket_instance = mock_socket.return_value
+    mock_socket_instance.sendmsg.side_effect = lambda buffers: sum(map(len, buffers))
+    mock_socket_instance.makefile.return_value = io.BytesIO(b"STRING EXISTS\nSTRING NOT FOUND\n")
+
+    assert basic_client.search_many(["query1", "query2"]) == ["STRING EXISTS", "STRING NOT FOUND"]
+    mock_socket_instance.connect.assert_called_once()
+    assert mock_socket_instance.sendmsg.call_args_list == [
+        call([b"query1", b"\n"]), call([b"query2", b"\n"])
+    ]
+
+
+def test_run_concurrent_async(capsys: pytest.CaptureFixture, basic_client: SearchClient) -> None:
+    """
+    Test running searches on the event loop over a shared worker connection.
+    """
+    from src.client import run_concurrent_async
+
+    with patch.object(basic_client, 'open_connection_async', new_callable=AsyncMock) as mock_open, \
+         patch.object(basic_client, 'search_async', new_callable=AsyncMock) as mock_search:
+        mock_open.return_value = (MagicMock(), MagicMock())
+        mock_search.side_effect = ["result1", "result2", ValueError("test error")]
+
+        asyncio.run(run_concurrent_async(basic_client, ["query1", "query2", "query3"], concurrency=1))
+
+    output = capsys.readouterr().out
+    assert "Query 'query1' => result1" in output
+    assert "Query 'query2' => result2" in output
+    assert "Query 'query3' generated an exception: test error" in output
+    mock_open.assert_called_once()
+
+
 def test_main_with_ssl(capsys: pytest.CaptureFixture) -> None:
     """
     Test the main function with SSL enabled.
@@ -127,7 +295,7 @@ def test_main_with_ssl(capsys: pytest.CaptureFixture) -> None:
 
     with patch('argparse.ArgumentParser.parse_args') as mock_args, \
          patch('src.client.SearchClient') as mock_client, \
-         patch('src.client.run_concurrent_searches') as mock_run, \
+         patch('src.client.run_concurrent_async', new_callable=AsyncMock) as mock_run, \
          patch('time.time') as mock_time:
 
         mock_args.return_value = MagicMock(
@@ -136,7 +304,8 @@ def test_main_with_ssl(capsys: pytest.CaptureFixture) -> None:
             no_ssl=False,
             cert=None,
             queries=["q1", "q2", "q3"],
-            threads=5
+            threads=5,
+            recv_buf_size=65536
         )
         mock_time.side_effect = [1000, 1002]  # start and end times
 
@@ -151,7 +320,8 @@ def test_main_with_ssl(capsys: pytest.CaptureFixture) -> None:
             host="testhost",
             port=1234,
             use_ssl=True,
-            cert_path=None
+            cert_path=None,
+            recv_buf_size=65536
         )
         mock_run.assert_called_once_with(mock_client.return_value, ["q1", "q2", "q3"], 5)
 
@@ -176,7 +346,8 @@ def test_main_without_ssl(capsys: pytest.CaptureFixture) -> None:
             no_ssl=True,
             cert=None,
             queries=["q1"],
-            threads=10
+            threads=10,
+            recv_buf_size=65536
         )
 
         from src.client import main, SearchClient
@@ -188,5 +359,6 @@ def test_main_without_ssl(capsys: pytest.CaptureFixture) -> None:
             host="testhost",
             port=1234,
             use_ssl=False,
-            cert_path=None
+            cert_path=None,
+            recv_buf_size=65536
         )
\ No newline at end of file
@@ -2,9 +2,11 @@ import pytest
 import tempfile
 import os
 import configparser
+import gc
 import logging
 from unittest.mock import MagicMock, patch
-from src.config.config import Config, ConfigError, ConfigValidationError, ConfigFileError
+import src.config.config as config_module
+from src.config.config import Config, ConfigError, ConfigValidationError, ConfigFileError, _scan_ini
 
 
 @pytest.fixture
@@ -112,6 +114,32 @@ def test_init_with_valid_config(valid_config_file):
     assert config.logger is not None
 
 
+def test_config_file_parsed_once(valid_config_file):
+    """Test that an unchanged config file is parsed once and reparsed after a change"""
+    with patch('src.config.config._scan_ini', wraps=_scan_ini) as mock_read:
+        first = Config(valid_config_file)
+        second = Config(valid_config_file)
+        assert mock_read.call_count == 1
+
+        second.config['SERVER']['PORT'] = '9090'
+        assert first.config['SERVER']['PORT'] == '8080'
+
+        second.save()
+        Config(valid_config_file)
+        assert mock_read.call_count == 2
+    second.close()
+
+
+def test_unsupported_syntax_falls_back_to_configparser(valid_config_file):
+    """Test that files outside the fast scanner's subset are still read by configparser"""
+    with open(valid_config_file, 'a') as f:
+        f.write("    continued value\n[DEFAULT]\nEXTRA = %(workers)s\n")
+
+    config = Config(valid_config_file)
+    assert config.log_file.endswith("test.log\ncontinued value")
+    assert config.get('SERVER', 'EXTRA') == '4'
+
+
 def test_init_with_ssl_config(ssl_config_file):
     """Test initialization with SSL enabled"""
     config = Config(ssl_config_file)
@@ -420,6 +448,44 @@ def test_logger_initialization(valid_config_file):
     assert len(config.logger.handlers) >= 1  # At least console handler
 
 
+def test_logger_is_lazy_and_queued(valid_config_file):
+    """Test that the logger is set up on first use and writes through its listener"""
+    config = Config(valid_config_file)
+    assert config._logger is None
+
+    config.logger.info("queued record")
+    config.close()
+
+    with open(config.log_file, encoding="utf-8") as f:
+        assert "queued record" in f.read()
+
+
+def test_logger_is_shared_between_configs(valid_config_file):
+    """Test that one configuration going away or closing never silences another's logger"""
+    config = Config(valid_config_file)
+    config.logger.info("first record")
+
+    def log_from_helper():
+        helper = Config(valid_config_file)
+        helper.logger.info("helper record")
+
+    log_from_helper()
+    gc.collect()
+    config.logger.info("after release record")
+
+    other = Config(valid_config_file)
+    other.logger.info("other record")
+    other.close()
+    assert config_module._log_listener is None
+    config.logger.info("after close record")
+    config.close()
+
+    with open(config.log_file, encoding="utf-8") as f:
+        content = f.read()
+    for record in ("first", "helper", "after release", "other", "after close"):
+        assert f"{record} record" in content
+
+
 def test_logger_file_creation_failure(temp_dir):
     """Test logger initialization when file creation fails"""
     config_file = os.path.join(temp_dir.name, "log_fail.conf")
@@ -475,6 +541,7 @@ def test_save_method(valid_config_file, temp_dir):
     new_config = Config(new_file)
     assert new_config.host == config.host
     assert new_config.port == config.port
+    config.close()
 
 
 def test_save_permission_denied(valid_config_file, temp_dir):
@@ -494,6 +561,7 @@ def test_save_permission_denied(valid_config_file, temp_dir):
     finally:
         # Restore permissions for cleanup
         os.chmod(readonly_dir, 0o755)
+        config.close()
 
 
 def test_remove_option(valid_config_file, temp_dir):
@@ -509,6 +577,18 @@ def test_remove_option(valid_config_file, temp_dir):
     # Verify option is removed
     assert config.get('SERVER', 'DEBUG') is None
 
+    with open(valid_config_file) as f:
+        original = f.read()
+
+    # The removal reaches the file on close, and the previous content is kept as a backup
+    config.close()
+    with open(f"{valid_config_file}.backup") as f:
+        assert f.read() == original
+    saved = configparser.ConfigParser()
+    saved.read(valid_config_file)
+    assert 'DEBUG' not in saved['SERVER']
+    assert not [name for name in os.listdir(temp_dir.name) if name.endswith(".tmp")]
+
 
 def test_remove_option_nonexistent_section(valid_config_file):
     """Test removing option from nonexistent section"""
@@ -537,10 +617,19 @@ def test_reload_config(valid_config_file, temp_dir):
     with open(valid_config_file, 'w') as f:
         modified_content.write(f)
     
+    config.logger.info("before reload")
+    listener = config_module._log_listener
+
     # Reload should pick up the change
     config.reload()
     assert config.host == 'localhost'
 
+    # Records logged under the old settings are written out before switching listeners
+    assert config_module._log_listener is not listener
+    with open(config.log_file, encoding="utf-8") as f:
+        assert "before reload" in f.read()
+    config.close()
+
 
 def test_reload_config_failure(valid_config_file):
     """Test reload when new config is invalid"""